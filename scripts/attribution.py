@@ -0,0 +1,69 @@
+"""
+AI MESH — 교차 종목 귀속 (검색 결과 하나를 언급된 모든 종목에)
+"엔비디아" 검색에서 나온 기사가 AMD · INTC도 충분히 다루면 그 종목들 목록에도 넣는다.
+그 종목들의 자체 검색은 이번 실행에서 이미 받은 만큼 줄이거나 건너뛴다.
+
+- 관련도: TickerMatcher.relevance() (제목 언급 1.0, 요약 언급 0.5씩, 최대 1.0)
+- NEWS_ATTRIBUTION_MIN (기본 1.0) 이상인 종목에만 귀속 — 기본은 제목 언급 또는 요약 2회 이상
+- Coverage: 이번 실행에서 종목별로 다른 검색을 통해 들어온 새 기사 수 (스레드 안전)
+
+병렬 검색 결과는 티커 순서대로 병합되고, 귀속(credit)도 그 병합 단계에서 티커 순서대로 센다.
+검색은 host 동시 실행 한도만큼씩 묶어(imap) 돌리고, 각 묶음의 검색은 묶음 시작 시점에 고정한
+귀속 수(planned)만 본다 — 스레드가 끝나는 순서와 무관하게 건너뛰기 결정이 같다.
+"""
+
+import threading
+from collections import Counter
+
+from env_config import env_number
+
+DEFAULT_ATTRIBUTION_MIN = 1.0
+
+
+def attribution_min():
+    return env_number("NEWS_ATTRIBUTION_MIN", DEFAULT_ATTRIBUTION_MIN)
+
+
+class Coverage:
+    def __init__(self, universe, threshold=None):
+        self.universe = set(universe)
+        self.threshold = attribution_min() if threshold is None else threshold
+        self.counts = Counter()
+        self.frozen = Counter()  # 현재 묶음 시작 시점의 counts
+        self.skipped = set()  # 귀속만으로 목표 수를 채워 자체 검색을 건너뛴 종목
+        self.lock = threading.Lock()
+
+    def targets(self, owner, scores):
+        """owner 검색에서 나온 기사를 함께 넣을 종목 (유니버스 안, 관련도 threshold 이상)"""
+        return sorted(t for t, score in scores.items()
+                      if t != owner and t in self.universe and score >= self.threshold)
+
+    def credit(self, tickers):
+        """병합 단계(티커 순서)에서 귀속된 종목 반영"""
+        with self.lock:
+            self.counts.update(tickers)
+
+    def count(self, ticker):
+        """지금까지 귀속된 새 기사 수"""
+        with self.lock:
+            return self.counts[ticker]
+
+    def planned(self, ticker):
+        """검색 스레드용 — 현재 묶음 시작 시점의 귀속 수"""
+        return self.frozen[ticker]
+
+    def imap(self, engine, fn, items, host):
+        """engine.imap을 host 동시 실행 한도만큼씩 — 묶음마다 귀속 수를 고정한 뒤 실행
+
+        호출 측이 앞 묶음의 결과를 모두 병합(credit)한 뒤에 다음 묶음이 시작된다.
+        """
+        items = list(items)
+        size = engine.host_limit(host)
+        for start in range(0, len(items), size):
+            with self.lock:
+                self.frozen = Counter(self.counts)
+            yield from engine.imap(fn, items[start:start + size], host)
+
+    def skip(self, ticker):
+        with self.lock:
+            self.skipped.add(ticker)
@@ -0,0 +1,65 @@
+"""
+AI MESH — 수집 체크포인트 저널 (append-only JSONL)
+티커 하나를 끝낼 때마다 한 줄씩 기록해 두고, 실행이 중간에 끊기면
+다음 실행에서 기록된 티커는 건너뛰고 이어서 수집한다.
+
+한 줄 형식:
+  {"stage": "profile", "ticker": "NVDA", "ts": "2026-...Z", "data": {...}}
+
+정상 종료(profiles.json/quotes.json 저장) 후에는 clear()로 파일을 지운다.
+프로필 · 번역 기록은 날짜가 지나도 유효하므로 다음 날 정기 실행에서도 이어받는다.
+시세(snapshot)는 기록하지 않는다 — 배치 몇 번이면 끝나므로 매 실행 전부 다시 받아
+모든 시세가 같은 시점의 값이 되게 한다.
+"""
+
+import os
+import json
+from datetime import datetime, timezone
+
+JOURNAL_FILENAME = "checkpoint.jsonl"
+
+
+class RunJournal:
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}  # stage → {ticker: data}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        resumed = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except Exception:
+                    continue  # 강제 종료로 잘린 마지막 줄
+                self.entries.setdefault(rec["stage"], {})[rec["ticker"]] = rec.get("data")
+                resumed += 1
+        if resumed:
+            print(f"  ♻️ 체크포인트 이어받기: {resumed}건")
+
+    def completed(self, stage):
+        """stage에서 이미 끝난 티커 → data"""
+        return self.entries.get(stage, {})
+
+    def record(self, stage, ticker, data):
+        """티커 하나 완료 — 즉시 디스크에 기록"""
+        self.entries.setdefault(stage, {})[ticker] = data
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        line = json.dumps({
+            "stage": stage,
+            "ticker": ticker,
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "data": data,
+        }, ensure_ascii=False)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self):
+        self.entries = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
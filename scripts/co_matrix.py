@@ -0,0 +1,216 @@
+"""
+AI MESH — 시간 감쇠 co-mention 행렬
+기사 × 종목 발생 행렬 X와 기사별 감쇠 가중치 w로
+종목 × 종목 동시 언급 가중치 C = Xᵀ · diag(w) · X 를 한 번에 계산한다.
+
+- 가중치: w = 0.5 ** (기사 나이(일) / 반감기) — 반감기 여러 개를 한 번에 계산
+- numpy가 있으면 희소 행렬곱을 벡터 연산으로, 없으면 같은 결과를 내는 순수 파이썬 경로
+- 같은 계산에서 연관도 지표도 함께 (N = 기사 수, n_i = 종목 i 기사 수, n_ij = 동시 언급 수):
+    PMI = log(n_ij·N / (n_i·n_j)), NPMI = PMI / −log(n_ij / N),
+    Jaccard = n_ij / (n_i + n_j − n_ij), lift = n_ij·N / (n_i·n_j)
+  대형주(NVDA, TSLA)는 어디에나 나오므로 원 건수 대신 이 지표로 엣지를 고른다.
+- 종목마다 상위 k개 엣지만 남겨(top-k 희소화) 작은 엣지 목록으로 내보낸다.
+
+설정 (환경변수):
+  - CO_MENTION_HALF_LIVES: 반감기(일) 목록 (기본 "7,30,90")
+  - CO_MENTION_SCORE: 엣지 선택 기준 npmi / pmi / jaccard / lift / count (기본 npmi)
+  - CO_MENTION_TOP_K: 종목당 남길 엣지 수 (기본 5)
+  - CO_MENTION_MIN_COUNT: 최소 동시 언급 기사 수 (기본 5 — 2~3건짜리 쌍은 NPMI가 과대평가돼 잡음이 상위에 오름)
+"""
+
+import os
+import math
+from itertools import accumulate, chain, combinations
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from env_config import env_number
+from news_store import parse_timestamp
+
+DEFAULT_HALF_LIVES = (7, 30, 90)
+DEFAULT_SCORE = "npmi"
+DEFAULT_TOP_K = 5
+DEFAULT_MIN_COUNT = 5
+
+# 엣지 한 줄의 지표 순서 (source, target 다음)
+METRICS = ["count", "npmi", "pmi", "jaccard", "lift"]
+
+
+def half_lives():
+    value = os.environ.get("CO_MENTION_HALF_LIVES", "").strip()
+    if not value:
+        return list(DEFAULT_HALF_LIVES)
+    try:
+        days = [float(v) for v in value.split(",") if v.strip()]
+        return [int(d) if d.is_integer() else d for d in days if d > 0] or list(DEFAULT_HALF_LIVES)
+    except ValueError:
+        print(f"  ⚠️ CO_MENTION_HALF_LIVES={value!r} 무시")
+        return list(DEFAULT_HALF_LIVES)
+
+
+def top_k():
+    return env_number("CO_MENTION_TOP_K", DEFAULT_TOP_K, int, minimum=1)
+
+
+def min_support():
+    return env_number("CO_MENTION_MIN_COUNT", DEFAULT_MIN_COUNT, int, minimum=1)
+
+
+def score_metric():
+    value = os.environ.get("CO_MENTION_SCORE", "").strip().lower() or DEFAULT_SCORE
+    if value not in METRICS:
+        print(f"  ⚠️ CO_MENTION_SCORE={value!r} 무시 → {DEFAULT_SCORE}")
+        return DEFAULT_SCORE
+    return value
+
+
+def article_time(article):
+    """기사 시각 → epoch 초 (수집 시 찍은 ts, 없으면 날짜 문자열 파싱; 알 수 없으면 None)"""
+    return article.get("ts") or parse_timestamp(article.get("date"))
+
+
+def _incidence(article_sets):
+    """→ (종목 목록, 기사별 종목 수, 모든 기사의 종목 인덱스를 이어 붙인 목록)
+
+    기사마다 리스트를 만들지 않는다 — 20만 건이면 할당 · GC만으로 수백 ms가 든다.
+    """
+    tickers = sorted(set().union(*(ts for _, ts in article_sets)))
+    col = {t: i for i, t in enumerate(tickers)}
+    lengths = [len(ts) for _, ts in article_sets]
+    flat = list(map(col.__getitem__, chain.from_iterable(ts for _, ts in article_sets)))
+    return tickers, lengths, flat
+
+
+def _ages(article_sets, indices, now):
+    """indices 기사들의 나이(일) — 시각을 모르면 0"""
+    now_ts = now.timestamp()
+    return [max(0.0, (now_ts - (article_time(article_sets[i][0]) or now_ts)) / 86400) for i in indices]
+
+
+def _matrix_numpy(n, lengths, flat, paired, ages, lives):
+    """희소 Xᵀ · diag(w) · X → (칸 번호 i·n + j 배열, (칸 수, 1 + H) 배열) — i < j, 0열 = 감쇠 없는 기사 수
+
+    X를 밀집 행렬로 만들지 않고, 기사별 종목 인덱스를 (기사 수, K) 배열로 한 번에 채워 행마다 정렬한 뒤
+    열 쌍 (a, b)의 (i, j) 칸을 모두 이어 붙여 값이 있는 칸에만 bincount 한다 (K = 기사당 최대 종목 수).
+    """
+    starts = np.cumsum(lengths) - lengths
+    padded = np.full((len(lengths), int(lengths.max())), n, dtype=np.int64)  # 빈 칸 = n
+    padded[np.repeat(np.arange(len(lengths)), lengths), np.arange(len(flat)) - np.repeat(starts, lengths)] = flat
+    padded = padded[paired]
+    padded.sort(axis=1)  # 빈 칸은 뒤로 — b 칸이 있으면 a 칸도 있음
+
+    cells, owners = [], []
+    for a, b in combinations(range(padded.shape[1]), 2):
+        r = np.nonzero(padded[:, b] < n)[0]
+        cells.append(padded[r, a] * n + padded[r, b])
+        owners.append(r)
+    cells, inverse = np.unique(np.concatenate(cells), return_inverse=True)
+    owners = np.concatenate(owners)
+
+    decay = 0.5 ** (np.asarray(ages)[owners, None] / np.asarray(lives, dtype=np.float64)[None, :])
+    total = np.empty((len(cells), 1 + len(lives)), dtype=np.float64)
+    total[:, 0] = np.bincount(inverse, minlength=len(cells))
+    for h in range(len(lives)):
+        total[:, 1 + h] = np.bincount(inverse, weights=decay[:, h], minlength=len(cells))
+    return cells, total
+
+
+def _matrix_python(n, rows, ages, lives):
+    total = {}
+    for cols, age in zip(rows, ages):
+        w = [1.0] + [0.5 ** (age / h) for h in lives]
+        for i, j in combinations(sorted(cols), 2):
+            acc = total.setdefault((i, j), [0.0] * len(w))
+            for h, value in enumerate(w):
+                acc[h] += value
+    return total
+
+
+def _pair_metrics_numpy(n_ij, n_i, n_j, total):
+    """(npmi, pmi, jaccard, lift) 배열 — 후보 쌍 전체를 한 번에"""
+    p_ij = n_ij / total
+    pmi = np.log(n_ij * total / (n_i * n_j))
+    npmi = pmi / np.maximum(-np.log(p_ij), 1e-12)
+    jaccard = n_ij / (n_i + n_j - n_ij)
+    return npmi, pmi, jaccard, np.exp(pmi)
+
+
+def _pair_metrics_python(n_ij, n_i, n_j, total):
+    pmi = math.log(n_ij * total / (n_i * n_j))
+    npmi = pmi / max(-math.log(n_ij / total), 1e-12)
+    return npmi, pmi, n_ij / (n_i + n_j - n_ij), math.exp(pmi)
+
+
+def _candidates(article_sets, n, lengths, flat, now, lives, min_count):
+    """support ≥ min_count 인 쌍 → [(i, j, count, npmi, pmi, jaccard, lift, w_h...)]"""
+    total = len(article_sets)
+    if np is not None and flat:
+        lengths, flat = np.asarray(lengths, dtype=np.int64), np.asarray(flat, dtype=np.int64)
+        paired = np.nonzero(lengths > 1)[0]  # 쌍이 없는 기사는 종목별 기사 수에만 반영
+        if not len(paired):
+            return []
+        ages = _ages(article_sets, paired.tolist(), now)
+        cells, matrix = _matrix_numpy(n, lengths, flat, paired, ages, lives)
+        keep = matrix[:, 0] >= min_count
+        cells, matrix = cells[keep], matrix[keep]
+        ii, jj = cells // n, cells % n
+        counts = np.bincount(flat, minlength=n).astype(np.float64)
+        metrics = _pair_metrics_numpy(matrix[:, 0], counts[ii], counts[jj], float(total))
+        return [
+            (i, j, int(round(row[0])), *m, *row[1:])
+            for i, j, row, *m in zip(ii.tolist(), jj.tolist(), matrix.tolist(),
+                                     *(x.tolist() for x in metrics))
+        ]
+    node_counts = [0] * n
+    for c in flat:
+        node_counts[c] += 1
+    starts = list(accumulate(lengths, initial=0))
+    paired = [a for a, size in enumerate(lengths) if size > 1]
+    rows = [flat[starts[a]:starts[a + 1]] for a in paired]
+    out = []
+    for (i, j), row in _matrix_python(n, rows, _ages(article_sets, paired, now), lives).items():
+        if row[0] >= min_count:
+            m = _pair_metrics_python(row[0], node_counts[i], node_counts[j], total)
+            out.append((i, j, int(round(row[0])), *m, *row[1:]))
+    return out
+
+
+def co_mention_graph(article_sets, now, lives=None, score=None, k=None, min_count=None):
+    """[(article, 종목 집합), ...] → 연관도 지표 + 시간 감쇠 가중치가 붙은 희소 엣지 목록
+
+    각 종목마다 score 기준 상위 k개 엣지만 남기고(양 끝 중 한쪽에서라도 뽑히면 유지),
+    score 내림차순으로 정렬한다.
+    """
+    lives = lives or half_lives()
+    score = score or score_metric()
+    k = k or top_k()
+    min_count = min_count or min_support()
+    tickers, lengths, flat = _incidence(article_sets)
+
+    candidates = _candidates(article_sets, len(tickers), lengths, flat, now, lives, min_count)
+    score_idx = 2 + METRICS.index(score)
+    ranked = sorted(candidates, key=lambda e: (-e[score_idx], e[0], e[1]))
+
+    degree = {}
+    kept = []
+    for edge in ranked:
+        i, j = edge[0], edge[1]
+        if degree.get(i, 0) < k or degree.get(j, 0) < k:
+            degree[i] = degree.get(i, 0) + 1
+            degree[j] = degree.get(j, 0) + 1
+            kept.append(edge)
+
+    fields = ["source", "target", *METRICS, *(f"w{h}" for h in lives)]
+    return {
+        "fields": fields,
+        "score": score,
+        "top_k": k,
+        "min_count": min_count,
+        "edges": [
+            [tickers[e[0]], tickers[e[1]], e[2], *(round(v, 4) for v in e[3:])]
+            for e in kept
+        ],
+    }
@@ -0,0 +1,125 @@
+"""
+AI MESH — co-mention 일별 버킷 (증분 집계)
+기사 발행일별로 "종목쌍 → 기사 수"를 따로 모아 두고, 매 실행마다
+새로 들어오거나 바뀐 기사만 반영한다. 90일 전체를 다시 세지 않는다.
+
+- 기사 id 기준으로 한 번만 센다 (여러 종목 목록에 들어 있어도 1건)
+- 기사의 종목 집합 = 본문 언급(mentions) ∪ 그 기사를 가진 종목들
+- 보관 기간을 벗어난 날짜 버킷은 통째로 버린다
+
+상태 파일(co_mention_buckets.json):
+  {"days": {"2026-05-04": {"articles": {"<id>": ["AMD", "NVDA"]}, "pairs": {"AMD-NVDA": 1}}}}
+"""
+
+import os
+import json
+from datetime import datetime
+from itertools import combinations
+
+from news_store import KST
+
+BUCKETS_FILENAME = "co_mention_buckets.json"
+MIN_CO_MENTIONS = 2
+
+
+def article_day(article, default):
+    """기사 시각(ts) → KST "YYYY-MM-DD" (ts가 없으면 날짜 문자열 앞부분, 알 수 없으면 default)"""
+    ts = article.get("ts")
+    if ts:
+        return datetime.fromtimestamp(ts, KST).strftime("%Y-%m-%d")
+    date = article.get("date") or ""
+    if len(date) >= 10 and date[4] == "-" and date[7] == "-":
+        return date[:10]
+    return default
+
+
+def article_tickers(store):
+    """기사 id → 종목 집합 (mentions ∪ 기사를 가진 종목)"""
+    owners = {}
+    for ticker, ids in store.stocks.items():
+        for aid in ids:
+            owners.setdefault(aid, set()).add(ticker)
+    for aid, tickers in owners.items():
+        tickers.update(store.articles[aid].get("mentions", []))
+    return owners
+
+
+class CoMentionBuckets:
+    def __init__(self, path, days=None):
+        self.path = path
+        self.days = days or {}  # day → {"articles": {id: [tickers]}, "pairs": {pair: n}}
+        self.day_of = {aid: day for day, b in self.days.items() for aid in b["articles"]}
+
+    @classmethod
+    def load(cls, path):
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return cls(path, json.load(f).get("days", {}))
+            except Exception as e:
+                print(f"  ⚠️ co-mention 버킷 로드 실패 (재계산): {e}")
+        return cls(path)
+
+    def _apply(self, day, tickers, sign):
+        pairs = self.days[day]["pairs"]
+        for a, b in combinations(sorted(tickers), 2):
+            pair = f"{a}-{b}"
+            pairs[pair] = pairs.get(pair, 0) + sign
+            if pairs[pair] <= 0:
+                del pairs[pair]
+
+    def remove(self, aid):
+        day = self.day_of.pop(aid, None)
+        if day is None:
+            return
+        tickers = self.days[day]["articles"].pop(aid)
+        self._apply(day, tickers, -1)
+        if not self.days[day]["articles"]:
+            del self.days[day]
+
+    def put(self, aid, day, tickers):
+        """기사 하나의 종목 집합을 (다시) 반영 — 바뀌지 않았으면 아무것도 안 함"""
+        tickers = sorted(tickers)
+        if self.day_of.get(aid) == day and self.days[day]["articles"].get(aid) == tickers:
+            return
+        self.remove(aid)
+        bucket = self.days.setdefault(day, {"articles": {}, "pairs": {}})
+        bucket["articles"][aid] = tickers
+        self.day_of[aid] = day
+        self._apply(day, tickers, +1)
+
+    def expire(self, cutoff_day):
+        """cutoff_day 이전 버킷 삭제"""
+        for day in [d for d in self.days if d < cutoff_day]:
+            for aid in self.days.pop(day)["articles"]:
+                self.day_of.pop(aid, None)
+
+    def sync(self, store, touched, today, full=False):
+        """저장소와 맞춤: 사라진 기사 제거 + 이번 실행에서 추가/변경된 기사만 재반영
+
+        full=True(규칙 변경으로 재검사한 경우)나 첫 실행이면 전체 기사를 다시 맞춘다.
+        """
+        if full or not self.days:
+            touched = store.articles.keys()
+        for aid in [a for a in self.day_of if a not in store.articles]:
+            self.remove(aid)
+        owners = article_tickers(store)
+        for aid in touched:
+            if aid in owners:
+                self.put(aid, article_day(store.articles[aid], today), owners[aid])
+
+    def totals(self, min_count=MIN_CO_MENTIONS):
+        counts = {}
+        for bucket in self.days.values():
+            for pair, n in bucket["pairs"].items():
+                counts[pair] = counts.get(pair, 0) + n
+        return {
+            k: v for k, v in sorted(counts.items(), key=lambda x: -x[1])
+            if v >= min_count
+        }
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"days": dict(sorted(self.days.items()))}, f,
+                      ensure_ascii=False, separators=(",", ":"))
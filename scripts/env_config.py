@@ -0,0 +1,27 @@
+"""
+AI MESH — 숫자 환경변수 설정 (공용)
+수집 스크립트들의 숫자 설정(레이트 리밋, 예산, 임계값 …)은 모두 env_number로 읽는다.
+
+  - 비어 있거나 없으면 default
+  - 숫자가 아니면 경고 후 default
+  - minimum / maximum이 있으면 그 범위로 잘라냄
+"""
+
+import os
+
+
+def env_number(name, default, cast=float, minimum=None, maximum=None):
+    """환경변수 name → 숫자 (cast: int 또는 float)"""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        print(f"  ⚠️ {name}={value!r} 무시 (숫자 아님)")
+        return default
+    if minimum is not None:
+        number = max(minimum, number)
+    if maximum is not None:
+        number = min(maximum, number)
+    return number
@@ -0,0 +1,103 @@
+"""
+AI MESH — 공용 동시 수집 엔진
+스레드 풀 하나에 작업을 넣고, 호스트별 동시 실행 개수를 제한한다.
+결과는 항상 입력(티커) 순서대로 돌려준다.
+
+설정 (환경변수):
+  - FETCH_WORKERS: 스레드 풀 크기 (기본 16)
+  - FETCH_HOST_LIMITS: 호스트별 동시 실행 한도 덮어쓰기
+      예) "api.massive.com=8,openapi.naver.com=4"
+
+호출 속도(분당/초당 한도)는 rate_limiter가 담당하고,
+이 엔진은 "동시에 몇 개까지"만 책임진다.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from env_config import env_number
+
+MASSIVE_HOST = "api.massive.com"
+NAVER_HOST = "openapi.naver.com"
+MYMEMORY_HOST = "api.mymemory.translated.net"
+BRANDFETCH_HOST = "cdn.brandfetch.io"
+
+DEFAULT_WORKERS = 16
+
+# 호스트별 기본 동시 실행 한도
+DEFAULT_HOST_LIMITS = {
+    MASSIVE_HOST: 4,
+    NAVER_HOST: 8,  # 호출 속도는 rate_limiter.naver_limiter가 제한
+    MYMEMORY_HOST: 4,
+    BRANDFETCH_HOST: 8,
+}
+DEFAULT_HOST_LIMIT = 4
+
+
+def _env_host_limits():
+    limits = {}
+    for part in os.environ.get("FETCH_HOST_LIMITS", "").split(","):
+        host, _, value = part.strip().partition("=")
+        if not host or not value:
+            continue
+        try:
+            limits[host.strip()] = max(1, int(value))
+        except ValueError:
+            print(f"  ⚠️ FETCH_HOST_LIMITS 항목 무시: {part!r}")
+    return limits
+
+
+class FetchEngine:
+    def __init__(self, max_workers=None, host_limits=None):
+        if max_workers is None:
+            max_workers = env_number("FETCH_WORKERS", DEFAULT_WORKERS, int, minimum=1)
+        self.max_workers = max_workers
+        self.host_limits = {**DEFAULT_HOST_LIMITS, **_env_host_limits(), **(host_limits or {})}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch")
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def host_limit(self, host):
+        """host의 동시 실행 한도"""
+        return self.host_limits.get(host, DEFAULT_HOST_LIMIT)
+
+    def _semaphore(self, host):
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.host_limit(host))
+            return self._semaphores[host]
+
+    def submit(self, host, fn, *args, **kwargs):
+        """host의 동시 실행 한도 안에서 fn(*args) 실행 → Future"""
+        sem = self._semaphore(host)
+
+        def run():
+            with sem:
+                return fn(*args, **kwargs)
+
+        return self.executor.submit(run)
+
+    def imap(self, fn, items, host):
+        """items 각각에 fn 실행 — (item, 결과)를 입력 순서대로 yield
+
+        앞 항목이 끝나는 즉시 돌려주므로 호출 측에서 진행 상황 출력이나
+        체크포인트 기록을 순서대로 처리할 수 있다.
+        """
+        items = list(items)
+        futures = [self.submit(host, fn, item) for item in items]
+        for item, future in zip(items, futures):
+            yield item, future.result()
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """프로세스 전체가 공유하는 엔진"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = FetchEngine()
+        return _engine
@@ -1,80 +1,92 @@
 """
-AI MESH — 로고 이미지 다운로드 스크립트
-Brandfetch CDN에서 각 티커의 로고를 다운로드하여 data/logos/에 저장
+AI MESH — 로고 이미지 다운로드 스크립트 (NASDAQ 100 + S&P 500)
+Brandfetch CDN에서 각 티커의 로고를 다운로드하여 유니버스별 logos 폴더에 저장
+  - NASDAQ 100 → data/logos/
+  - S&P 500    → data/sp500/logos/
 
 사용법:
   python scripts/fetch_logos.py
+  (대상 유니버스: LOGO_UNIVERSES 환경변수, 기본 "nasdaq100,sp500")
 
 참고:
   - 1회성 실행 (로고는 자주 바뀌지 않음)
+  - 두 유니버스에 겹치는 티커는 한 번만 받고, 이미 한쪽에 있으면 복사만 함
   - 실패한 티커는 텍스트 폴백으로 처리됨
 """
 
 import os
-import time
-import urllib.request
-import urllib.error
-
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "logos")
-
-TICKERS = [
-    "NVDA","AVGO","ASML","AMD","QCOM","TXN","ARM","AMAT","INTC","ADI",
-    "MU","LRCX","KLAC","MRVL","NXPI","MCHP","MPWR","STX","WDC",
-    "AAPL","MSFT","AMZN","GOOGL","META","TSLA","NFLX",
-    "CSCO","PLTR","CDNS","SNPS","ADBE","INTU","ADP","WDAY",
-    "DDOG","VRSK","CTSH","CSGP","PAYX","MSTR","PANW","CRWD",
-    "FTNT","ZS","TEAM","ADSK","SHOP","ROP","TRI",
-    "BKNG","MELI","APP","ABNB","PYPL","DASH","EA","TTWO",
-    "PDD","WBD","MAR","ROST","WMT",
-    "CHTR","CMCSA","COST","PEP","TMUS","SBUX","MDLZ","MNST",
-    "KHC","KDP","CCEP","CEG","XEL","AEP","EXC",
-    "ISRG","AMGN","VRTX","GILD","REGN","GEHC","DXCM","IDXX","ALNY","INSM","LIN",
-    "HON","AXON","CSX","CPRT","ODFL","FAST","FANG","BKR","FER","PCAR","ORLY","CTAS",
-]
-
-LOGO_URL = "https://cdn.brandfetch.io/ticker/{ticker}/w/400/h/400?c=1idPsssS9J0WktYMOvD"
+import shutil
 
+from fetch_engine import get_engine, BRANDFETCH_HOST
+from http_client import get_client, RequestError
+from universe import UNIVERSES, union, parse_universes
 
-def download_logo(ticker):
-    """단일 로고 다운로드"""
-    url = LOGO_URL.format(ticker=ticker)
-    filepath = os.path.join(DATA_DIR, f"{ticker}.png")
+DEFAULT_UNIVERSES = ["nasdaq100", "sp500"]
 
-    # 이미 존재하면 스킵
-    if os.path.exists(filepath) and os.path.getsize(filepath) > 500:
-        return "skip"
+LOGO_URL = "https://cdn.brandfetch.io/ticker/{ticker}/w/400/h/400?c=1idPsssS9J0WktYMOvD"
 
-    req = urllib.request.Request(url, headers={
-        "User-Agent": "AI-MESH/1.0",
-        "Accept": "image/*",
-    })
 
-    try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = resp.read()
-            if len(data) < 500:  # 너무 작으면 유효하지 않은 이미지
-                return "invalid"
-            with open(filepath, "wb") as f:
-                f.write(data)
-            return "ok"
-    except urllib.error.HTTPError as e:
-        return f"http_{e.code}"
-    except Exception as e:
-        return f"error"
+def is_valid_logo(filepath):
+    return os.path.exists(filepath) and os.path.getsize(filepath) > 500
 
 
-def main():
-    os.makedirs(DATA_DIR, exist_ok=True)
-    print(f"=== AI MESH 로고 다운로드 ({len(TICKERS)}개) ===\n")
+def download_logo(ticker, logo_dirs):
+    """단일 로고 다운로드 → logo_dirs 전체에 저장"""
+    paths = [os.path.join(d, f"{ticker}.png") for d in logo_dirs]
 
-    results = {"ok": [], "skip": [], "fail": []}
-
-    for i, ticker in enumerate(TICKERS):
-        status = download_logo(ticker)
+    # 이미 존재하면 스킵 (다른 유니버스 폴더에만 있으면 복사)
+    missing = [p for p in paths if not is_valid_logo(p)]
+    if not missing:
+        return "skip"
+    sources = [os.path.join(u["logo_dir"], f"{ticker}.png") for u in UNIVERSES.values()]
+    source = next((p for p in sources if is_valid_logo(p)), None)
+    if source:
+        for p in missing:
+            shutil.copyfile(source, p)
+        return "copy"
 
+    url = LOGO_URL.format(ticker=ticker)
+    try:
+        resp = get_client().get(url, headers={"Accept": "image/*"}, timeout=15)
+    except RequestError:
+        return "error"
+    if not resp.ok:
+        return f"http_{resp.status}"
+    if len(resp.body) < 500:  # 너무 작으면 유효하지 않은 이미지
+        return "invalid"
+    for p in missing:
+        with open(p, "wb") as f:
+            f.write(resp.body)
+    return "ok"
+
+
+def main(universes=None):
+    universes = universes or parse_universes(os.environ.get("LOGO_UNIVERSES"), DEFAULT_UNIVERSES)
+    tickers = union(universes)
+
+    # 티커 → 저장할 logos 폴더 목록
+    targets = {t: [] for t in tickers}
+    for name in universes:
+        logo_dir = UNIVERSES[name]["logo_dir"]
+        os.makedirs(logo_dir, exist_ok=True)
+        for t in UNIVERSES[name]["tickers"]:
+            if logo_dir not in targets[t]:
+                targets[t].append(logo_dir)
+
+    labels = " + ".join(UNIVERSES[n]["label"] for n in universes)
+    print(f"=== AI MESH {labels} 로고 다운로드 ({len(tickers)}개) ===\n")
+
+    results = {"ok": [], "copy": [], "skip": [], "fail": []}
+
+    # 다운로드는 엔진에서 병렬로 (호스트별 동시 실행 한도), 결과 출력은 티커 순서대로
+    jobs = get_engine().imap(lambda t: download_logo(t, targets[t]), tickers, BRANDFETCH_HOST)
+    for i, (ticker, status) in enumerate(jobs):
         if status == "ok":
             results["ok"].append(ticker)
             icon = "✓"
+        elif status == "copy":
+            results["copy"].append(ticker)
+            icon = "⇢"
         elif status == "skip":
             results["skip"].append(ticker)
             icon = "—"
@@ -82,14 +94,11 @@ def main():
             results["fail"].append(ticker)
             icon = "✗"
 
-        print(f"  {icon} [{i+1:3d}/{len(TICKERS)}] {ticker:6s} → {status}")
-
-        # Rate limiting
-        if status != "skip":
-            time.sleep(0.3)
+        print(f"  {icon} [{i+1:3d}/{len(tickers)}] {ticker:6s} → {status}")
 
     print(f"\n=== 결과 ===")
     print(f"  새로 다운로드: {len(results['ok'])}개")
+    print(f"  다른 유니버스에서 복사: {len(results['copy'])}개")
     print(f"  이미 존재 (스킵): {len(results['skip'])}개")
     print(f"  실패: {len(results['fail'])}개")
     if results["fail"]:
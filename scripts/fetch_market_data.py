@@ -1,101 +1,81 @@
 """
-AI MESH — NASDAQ 100 시장 데이터 수집 (Massive API)
-GitHub Actions에서 주기적으로 실행하여 data/ 에 JSON 저장
+AI MESH — 시장 데이터 수집 (Massive API) — NASDAQ 100 + S&P 500
+GitHub Actions에서 주기적으로 실행하여 data/, data/sp500/ 에 JSON 저장
+
+두 유니버스에 겹치는 종목은 한 번만 수집하고(universe.py의 합집합),
+결과를 유니버스별 profiles.json / quotes.json 으로 나눠 저장한다.
+대상 유니버스: MARKET_UNIVERSES 환경변수 (기본 "nasdaq100,sp500")
 
 엔드포인트:
-  - 프로필: GET /v3/reference/tickers/{ticker}
-  - 스냅샷: GET /v2/snapshot/locale/us/markets/stocks/tickers/{ticker}
+  - 프로필: GET /v3/reference/tickers/{ticker}  (profile_cache.json TTL 만료분만)
+  - 스냅샷: GET /v2/snapshot/locale/us/markets/stocks/tickers?tickers=A,B,...  (배치)
   - 번역: MyMemory API (description → descriptionKr)
 """
 
 import os
-import json
-import time
-import urllib.request
-import urllib.error
 import urllib.parse
 from datetime import datetime, timezone, timedelta
 
+from rate_limiter import massive_limiter
+from http_client import get_client, RequestError
+from publish import publish_json, describe
+from translation import TranslationMemory, MEMORY_FILENAME, PROVIDER_SOURCE, translate_many
+from profile_cache import ProfileCache, CACHE_FILENAME, forced_refresh
+from checkpoint import RunJournal, JOURNAL_FILENAME
+from fetch_engine import get_engine, MASSIVE_HOST
+from universe import UNIVERSES, DATA_ROOT, tickers as universe_tickers, union, parse_universes
+
 API_KEY = os.environ.get("MASSIVE_API_KEY", "")
 API_BASE = "https://api.massive.com"
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
-
-# NASDAQ 100 — 100 companies (exact match with nasdaq100.html)
-TICKERS = [
-    "NVDA","AVGO","ASML","AMD","QCOM","TXN","ARM","AMAT","INTC","ADI",
-    "MU","LRCX","KLAC","MRVL","NXPI","MCHP","MPWR","STX","WDC","AAPL",
-    "MSFT","AMZN","GOOGL","META","TSLA","NFLX","CSCO","PLTR","CDNS","SNPS",
-    "ADBE","INTU","ADP","WDAY","DDOG","VRSK","CTSH","CSGP","PAYX","MSTR",
-    "PANW","CRWD","FTNT","ZS","TEAM","ADSK","SHOP","ROP","TRI","BKNG",
-    "MELI","APP","ABNB","PYPL","DASH","EA","TTWO","PDD","WBD","MAR",
-    "ROST","WMT","CHTR","CMCSA","COST","PEP","TMUS","SBUX","MDLZ","MNST",
-    "KHC","KDP","CCEP","CEG","XEL","AEP","EXC","ISRG","AMGN","VRTX",
-    "GILD","REGN","GEHC","DXCM","IDXX","ALNY","INSM","LIN","HON","AXON",
-    "CSX","CPRT","ODFL","FAST","FANG","BKR","FER","PCAR","ORLY","CTAS",
-]
+# 캐시/체크포인트는 유니버스 공용 (data/)
+DATA_DIR = DATA_ROOT
+DEFAULT_UNIVERSES = ["nasdaq100", "sp500"]
+
+# 멀티 티커 스냅샷 1회 호출당 종목 수 (URL 길이 여유 포함)
+SNAPSHOT_BATCH_SIZE = 250
+# 프로필 캐시 중간 저장 간격 (티커 수) — 중단돼도 받은 프로필은 캐시에 남는다
+PROFILE_SAVE_EVERY = 25
 
 
 def fetch_json(url):
-    req = urllib.request.Request(url, headers={
-        "User-Agent": "AI-MESH/1.0",
-        "Authorization": f"Bearer {API_KEY}",
-    })
+    """Massive API GET — 공용 클라이언트 + 레이트 리미터 (429/5xx 재시도는 클라이언트가 처리)"""
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        body = ""
-        try:
-            body = e.read().decode()[:200]
-        except:
-            pass
-        print(f"    HTTP {e.code}: {body[:100]}")
+        resp = get_client().get(url, headers={"Authorization": f"Bearer {API_KEY}"},
+                                timeout=30, limiter=massive_limiter(API_KEY))
+    except RequestError as e:
+        print(f"    Error: {e}")
+        return None
+    if not resp.ok:
+        print(f"    HTTP {resp.status}: {resp.text()[:100]}")
         return None
-    except Exception as e:
+    try:
+        return resp.json()
+    except ValueError as e:
         print(f"    Error: {e}")
         return None
 
 
-def translate_text(text):
-    """MyMemory API로 영→한 번역 (500자 제한이라 청크 분할)"""
-    if not text:
-        return ""
-    chunks = []
-    for i in range(0, len(text), 400):
-        chunks.append(text[i:i+400])
-
-    results = []
-    for chunk in chunks:
-        url = f"https://api.mymemory.translated.net/get?q={urllib.parse.quote(chunk)}&langpair=en|ko"
-        try:
-            req = urllib.request.Request(url, headers={"User-Agent": "AI-MESH/1.0"})
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                data = json.loads(resp.read().decode())
-                translated = data.get("responseData", {}).get("translatedText", "")
-                if translated and "MYMEMORY WARNING" not in translated:
-                    results.append(translated)
-                else:
-                    results.append(chunk)
-        except:
-            results.append(chunk)
-        if len(chunks) > 1:
-            time.sleep(1)
-
-    return "".join(results)
-
-
-def fetch_profiles_and_snapshots():
-    """프로필 + 스냅샷을 한 번에 수집 (API 호출 효율화)"""
-    print(f"\n[1/2] 기업 프로필 + 시세 수집 중... ({len(TICKERS)}개)")
-    all_data = {}
+def fetch_profiles(tickers, journal):
+    """프로필 수집 (캐시 TTL 만료분만 티커별 호출)"""
+    print(f"\n[1/3] 기업 프로필 수집 중... ({len(tickers)}개)")
+    cache = ProfileCache.load(
+        os.path.join(DATA_DIR, CACHE_FILENAME),
+        seed_paths=[os.path.join(u["data_dir"], "profiles.json") for u in UNIVERSES.values()],
+    )
+    # 중단된 이전 실행에서 이미 받은 프로필은 저널에서 복원
+    resumed = journal.completed("profile")
+    for ticker, profile in resumed.items():
+        cache.put(ticker, profile)
+    due = {t: g for t, g in cache.due_groups(tickers, forced_refresh()).items() if t not in resumed}
+    stale = list(due)
+    print(f"  캐시 사용: {len(tickers) - len(stale)}개, 새로 수집: {len(stale)}개")
     fail_count = 0
 
-    for i, ticker in enumerate(TICKERS):
-        # 프로필
-        url = f"{API_BASE}/v3/reference/tickers/{ticker}?apiKey={API_KEY}"
-        data = fetch_json(url)
+    def fetch_one(ticker):
+        return fetch_json(f"{API_BASE}/v3/reference/tickers/{ticker}?apiKey={API_KEY}")
 
-        profile = {}
+    # 호출은 엔진에서 병렬로, 결과 처리(캐시/저널)는 티커 순서대로
+    for i, (ticker, data) in enumerate(get_engine().imap(fetch_one, stale, MASSIVE_HOST)):
         if data and data.get("status") == "OK" and data.get("results"):
             r = data["results"]
             profile = {
@@ -112,140 +92,213 @@ def fetch_profiles_and_snapshots():
                 "image": (r.get("branding", {}) or {}).get("icon_url", ""),
                 "mktCap": r.get("market_cap", 0),
             }
+            # TTL이 지난 그룹만 반영 (나머지 그룹은 각자의 TTL까지 캐시 값 유지)
+            cache.put(ticker, profile, due[ticker])
+            journal.record("profile", ticker, profile)
         else:
             fail_count += 1
-            profile = {"symbol": ticker}
             if fail_count <= 5:
                 print(f"  ✗ {ticker} 프로필 실패")
 
-        time.sleep(12.5)  # 5 calls/min
-
-        # 스냅샷
-        url2 = f"{API_BASE}/v2/snapshot/locale/us/markets/stocks/tickers/{ticker}?apiKey={API_KEY}"
-        snap = fetch_json(url2)
-
-        if snap and snap.get("status") == "OK" and snap.get("ticker"):
-            t = snap["ticker"]
-            day = t.get("day", {}) or {}
-            prev = t.get("prevDay", {}) or {}
-
-            close = day.get("c") or prev.get("c") or 0
-            prev_close = prev.get("c") or 0
-            change = round(close - prev_close, 2) if close and prev_close else 0
-            pct = round((change / prev_close) * 100, 2) if prev_close else 0
+        if (i + 1) % 10 == 0:
+            print(f"  ✓ {i+1}/{len(stale)} 완료")
+        if (i + 1) % PROFILE_SAVE_EVERY == 0:
+            cache.save()
 
-            profile.update({
-                "price": close,
-                "change": change,
-                "changesPercentage": pct,
-                "volume": day.get("v") or prev.get("v") or 0,
-                "marketCap": t.get("market_cap", 0) or profile.get("mktCap", 0),
-            })
+    cache.save()
 
-        time.sleep(12.5)
+    # 실패한 티커는 이전 캐시 값을 그대로 사용 (캐시에도 없으면 스냅샷이 있을 때만 항목이 생김)
+    all_data = {t: cache.get(t) for t in tickers if cache.get(t)}
+    print(f"  총 {len(all_data)}개 프로필 준비 완료 (실패: {fail_count}개)")
+    return all_data
 
-        all_data[ticker] = profile
 
-        if (i + 1) % 10 == 0:
-            print(f"  ✓ {i+1}/{len(TICKERS)} 완료")
-
-    print(f"  총 {len(all_data)}개 수집 완료 (실패: {fail_count}개)")
+def snapshot_record(t, fallback_mktcap=0):
+    """스냅샷 응답의 ticker 객체 → price/change/changesPercentage/volume/marketCap"""
+    day = t.get("day", {}) or {}
+    prev = t.get("prevDay", {}) or {}
+
+    close = day.get("c") or prev.get("c") or 0
+    prev_close = prev.get("c") or 0
+    change = round(close - prev_close, 2) if close and prev_close else 0
+    pct = round((change / prev_close) * 100, 2) if prev_close else 0
+
+    return {
+        "price": close,
+        "change": change,
+        "changesPercentage": pct,
+        "volume": day.get("v") or prev.get("v") or 0,
+        "marketCap": t.get("market_cap", 0) or fallback_mktcap,
+    }
+
+
+def fetch_snapshots(tickers, all_data):
+    """멀티 티커 스냅샷 — 한 번의 호출로 전 종목 시세를 같은 시점에 수집
+
+    체크포인트로 이어받지 않는다: 이전 실행의 시세와 섞이지 않도록 매번 모든 배치를 다시 받는다.
+    """
+    print(f"\n[2/3] 시세 스냅샷 수집 중... (배치 모드)")
+    success = fail = 0
+
+    batches = [tickers[i:i + SNAPSHOT_BATCH_SIZE] for i in range(0, len(tickers), SNAPSHOT_BATCH_SIZE)]
+
+    def fetch_batch(batch):
+        tickers_param = urllib.parse.quote(",".join(batch), safe=",.")
+        return fetch_json(f"{API_BASE}/v2/snapshot/locale/us/markets/stocks/tickers?tickers={tickers_param}&apiKey={API_KEY}")
+
+    for batch, data in get_engine().imap(fetch_batch, batches, MASSIVE_HOST):
+        found = {}
+        if data and data.get("status") == "OK":
+            for t in data.get("tickers") or []:
+                if t.get("ticker"):
+                    found[t["ticker"]] = t
+
+        for ticker in batch:
+            t = found.get(ticker)
+            if not t:
+                fail += 1
+                continue
+            profile = all_data.setdefault(ticker, {"symbol": ticker})
+            profile.update(snapshot_record(t, profile.get("mktCap", 0)))
+            success += 1
+
+    print(f"  스냅샷 수집: {success}개 성공, {fail}개 실패")
     return all_data
 
 
-def translate_descriptions(all_data):
-    """기업 개요 한국어 번역"""
-    print(f"\n[2/2] 기업 개요 번역 중...")
+def translate_descriptions(all_data, journal):
+    """기업 개요 한국어 번역 (원문 해시 기반 번역 메모리 재사용)"""
+    print(f"\n[3/3] 기업 개요 번역 중...")
 
-    # 기존 번역 로드 (이미 번역된 건 스킵)
-    profiles_path = os.path.join(DATA_DIR, "profiles.json")
-    existing_translations = {}
-    if os.path.exists(profiles_path):
-        try:
-            with open(profiles_path, "r", encoding="utf-8") as f:
-                old = json.load(f)
-            for sym, d in old.get("data", {}).items():
-                if d.get("descriptionKr"):
-                    existing_translations[sym] = d["descriptionKr"]
-        except:
-            pass
+    # 번역 메모리가 처음이면 모든 유니버스의 기존 profiles.json으로 seed
+    memory = TranslationMemory.load(
+        os.path.join(DATA_DIR, MEMORY_FILENAME),
+        seed_profiles=[os.path.join(u["data_dir"], "profiles.json") for u in UNIVERSES.values()],
+    )
 
+    resumed = journal.completed("translation")
     translated_count = 0
     skipped_count = 0
 
-    for i, (ticker, d) in enumerate(all_data.items()):
+    pending = []
+    for ticker, d in all_data.items():
         desc = d.get("description", "")
         if not desc:
             continue
 
-        # 기존 번역이 있으면 재사용
-        if ticker in existing_translations:
-            d["descriptionKr"] = existing_translations[ticker]
+        if ticker in resumed:
+            d["descriptionKr"] = resumed[ticker]
+            skipped_count += 1
+            continue
+
+        # 같은 원문의 번역이 메모리에 있으면 재사용
+        kr = memory.lookup(desc)
+        if kr is not None:
+            d["descriptionKr"] = kr
             skipped_count += 1
             continue
 
-        kr = translate_text(desc)
-        d["descriptionKr"] = kr
+        pending.append(ticker)
+
+    def on_done(ticker, kr):
+        nonlocal translated_count
+        all_data[ticker]["descriptionKr"] = kr
+        journal.record("translation", ticker, kr)
         translated_count += 1
 
-        if (i + 1) % 10 == 0:
+        if translated_count % 10 == 0:
             print(f"  ✓ {translated_count}개 번역 완료")
+            memory.save()
 
-        time.sleep(0.5)
+    # 문장 단위 청크를 중복 제거해 병렬 번역, 완료된 티커부터 순서대로 기록
+    translate_many({t: all_data[t]["description"] for t in pending}, memory, on_done)
 
-    print(f"  번역 완료: {translated_count}개 새로, {skipped_count}개 재사용")
+    memory.save()
+    retry = memory.stats().get(PROVIDER_SOURCE, 0)
+    print(f"  번역 완료: {translated_count}개 새로, {skipped_count}개 재사용 (실패 청크 {retry}개는 다음 실행에서 재시도)")
     return all_data
 
 
-def save_json(data, filename):
-    os.makedirs(DATA_DIR, exist_ok=True)
-    filepath = os.path.join(DATA_DIR, filename)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    size_kb = os.path.getsize(filepath) / 1024
-    print(f"  → {filename} 저장 ({size_kb:.1f} KB)")
+def save_json(data, data_dir, filename):
+    filepath = os.path.join(data_dir, filename)
+    entry = publish_json(data, data_dir, filename, indent=2)
+    size_kb = entry["bytes"] / 1024
+    rel = os.path.relpath(filepath, DATA_ROOT)
+    print(f"  → {rel} 저장 ({size_kb:.1f} KB · {describe(entry)})")
 
 
-def main():
+def write_universe(name, all_data, now_kst):
+    """합집합 수집 결과 → 해당 유니버스의 profiles.json / quotes.json (받은 데이터가 없는 종목은 제외)"""
+    u = UNIVERSES[name]
+    data = {}
+    for sym in universe_tickers(name):
+        if sym not in all_data:
+            continue
+        d = dict(all_data[sym])
+        if name == "sp500":
+            d.setdefault("ceo", "")  # 기존 S&P 500 profiles.json 필드 호환
+        data[sym] = d
+
+    save_json({
+        "updated_kst": now_kst,
+        "count": len(data),
+        "data": data,
+    }, u["data_dir"], "profiles.json")
+
+    # quotes.json (클라이언트 호환용)
+    quotes = {}
+    for sym, d in data.items():
+        quotes[sym] = {
+            "symbol": sym,
+            "price": d.get("price"),
+            "change": d.get("change"),
+            "changesPercentage": d.get("changesPercentage"),
+            # 기존 스크립트별 우선순위 유지 — S&P 500은 프로필 mktCap, NASDAQ 100은 스냅샷 marketCap 우선
+            "marketCap": (d.get("mktCap") or d.get("marketCap", 0)) if name == "sp500"
+                         else (d.get("marketCap") or d.get("mktCap", 0)),
+        }
+    save_json({
+        "updated_kst": now_kst,
+        "count": len(quotes),
+        "data": quotes,
+    }, u["data_dir"], "quotes.json")
+
+
+def main(universes=None):
     if not API_KEY:
         print("ERROR: MASSIVE_API_KEY 환경변수가 설정되지 않았습니다.")
         exit(1)
 
+    universes = universes or parse_universes(os.environ.get("MARKET_UNIVERSES"), DEFAULT_UNIVERSES)
+    tickers = union(universes)
+
     print(f"API Key: {API_KEY[:4]}...{API_KEY[-4:]} (길이: {len(API_KEY)})")
 
     kst = timezone(timedelta(hours=9))
     now_kst = datetime.now(kst).strftime("%Y-%m-%d %H:%M KST")
-    print(f"=== AI MESH NASDAQ 100 시장 데이터 수집 ({now_kst}) ===")
+    labels = " + ".join(UNIVERSES[n]["label"] for n in universes)
+    print(f"=== AI MESH {labels} 시장 데이터 수집 ({now_kst}) ===")
+    total = sum(len(universe_tickers(n)) for n in universes)
+    print(f"    총 {len(tickers)}개 종목 (유니버스 합계 {total}개, 중복 {total - len(tickers)}개 1회만 수집)")
+
+    # 1. 프로필 수집
+    journal = RunJournal(os.path.join(DATA_DIR, JOURNAL_FILENAME))
+    all_data = fetch_profiles(tickers, journal)
 
-    # 1. 프로필 + 시세 수집
-    all_data = fetch_profiles_and_snapshots()
+    # 2. 스냅샷(시세) 일괄 수집
+    all_data = fetch_snapshots(tickers, all_data)
 
-    # 2. 번역
-    all_data = translate_descriptions(all_data)
+    # 3. 번역
+    all_data = translate_descriptions(all_data, journal)
 
     if all_data:
-        # profiles.json
-        save_json({
-            "updated_kst": now_kst,
-            "count": len(all_data),
-            "data": all_data,
-        }, "profiles.json")
-
-        # quotes.json (클라이언트 호환용)
-        quotes = {}
-        for sym, d in all_data.items():
-            quotes[sym] = {
-                "symbol": sym,
-                "price": d.get("price"),
-                "change": d.get("change"),
-                "changesPercentage": d.get("changesPercentage"),
-                "marketCap": d.get("marketCap") or d.get("mktCap", 0),
-            }
-        save_json({
-            "updated_kst": now_kst,
-            "count": len(quotes),
-            "data": quotes,
-        }, "quotes.json")
+        # 4. 유니버스별 저장
+        print(f"\n💾 저장 중...")
+        for name in universes:
+            write_universe(name, all_data, now_kst)
+
+        # 최종 파일 저장까지 끝났으므로 체크포인트 정리
+        journal.clear()
 
     print(f"\n=== 완료! {len(all_data)}개 기업 데이터 수집 ===")
 
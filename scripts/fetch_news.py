@@ -6,19 +6,41 @@ NASDAQ 100 뉴스 수집기 — 네이버 검색 API
 핵심:
 - 90일(3개월) 누적 방식
 - 경제/금융 뉴스만 필터 (엔터/문화 제외)
-- 중복 기사 제거 (URL + 제목 유사도)
+- 중복 기사 제거 (URL + 제목 + 고쳐 쓴 유사 기사)
 - 네이버 뉴스 링크 우회 차단
 """
 
-import os, json, time, urllib.request, urllib.parse, re
+import os, urllib.parse, re
 from datetime import datetime, timezone, timedelta
 from email.utils import parsedate_to_datetime
 
+from fetch_engine import get_engine, NAVER_HOST
+from http_client import get_client, RequestError
+from rate_limiter import naver_limiter, QuotaExhausted, NAVER_QUOTA_FILENAME
+from publish import publish_json, publish_gzip, describe, NEWS_MANIFEST_FILENAME
+from news_queries import NASDAQ100_QUERIES as TICKER_QUERIES
+from ticker_matcher import TickerMatcher
+from news_filter import RelevanceFilter
+from attribution import Coverage
+from query_stats import QueryStats, STATS_FILENAME
+from news_store import (NewsStore, STORE_FILENAME, article_id, parse_timestamp,
+                        sort_by_time, insert_by_time, prune_before)
+from co_mentions import CoMentionBuckets, BUCKETS_FILENAME, article_tickers
+from co_matrix import co_mention_graph
+from news_dedupe import DedupeIndex, NearDupIndex, DEDUPE_VERSION, article_keys, deduplicate_articles
+
 CLIENT_ID = os.environ["NAVER_CLIENT_ID"]
 CLIENT_SECRET = os.environ["NAVER_CLIENT_SECRET"]
 
 RETENTION_DAYS = 90
 
+# 네이버 일일 호출 카운터 — 같은 Client ID를 쓰는 S&P 500 수집기와 공유
+QUOTA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "data", NAVER_QUOTA_FILENAME)
+
+# 종목 언급 추출기 — 별칭 테이블로 프로세스당 한 번 컴파일
+MATCHER = TickerMatcher(TICKER_QUERIES)
+
 # ═══ 허용 언론사 도메인 (경제/금융 전문지만) ═══
 ALLOWED_DOMAINS = [
     "mk.co.kr",           # 매일경제
@@ -70,6 +92,12 @@ FINANCE_KEYWORDS = [
     "달러", "환율", "금리", "연준",
 ]
 
+# 제외/경제 키워드를 한 번에 훑는 컴파일된 필터 (규칙이 바뀌면 FILTER.version도 바뀜)
+FILTER = RelevanceFilter(EXCLUDE_KEYWORDS, FINANCE_KEYWORDS)
+
+# 종목 목록별로 기록하는 검증 규칙 버전 (필터 · 중복 · 언급 태깅) — 같으면 다음 실행에서 재검사를 건너뜀
+VALIDATION_VERSION = f"{FILTER.version}+{DEDUPE_VERSION}+{MATCHER.version}"
+
 
 def is_allowed_source(url):
     if not url:
@@ -82,100 +110,26 @@ def is_allowed_source(url):
 
 
 def is_financial_news(title, desc):
-    combined = title + " " + desc
-    exclude_count = sum(1 for kw in EXCLUDE_KEYWORDS if kw in combined)
-    if exclude_count >= 2:
-        return False
-    if exclude_count >= 1:
-        has_finance = any(kw in combined for kw in FINANCE_KEYWORDS)
-        if not has_finance:
-            return False
-    return True
-
-
-def normalize_title(title):
-    """제목 정규화 — 중복 비교용"""
-    return re.sub(r"[^\w가-힣]", "", title).lower()
-
-
-def is_duplicate(new_title, new_url, existing_articles):
-    """URL + 제목 유사도로 중복 체크"""
-    # URL 정규화 (파라미터 제거)
-    def clean_url(u):
-        return u.split("?")[0].split("#")[0].rstrip("/") if u else ""
-
-    clean_new = clean_url(new_url)
-    norm_new = normalize_title(new_title)
-
-    for art in existing_articles:
-        # URL 중복
-        if clean_new and clean_new == clean_url(art.get("url", "")):
-            return True
-
-        # 제목 유사도 — 정규화된 제목의 앞 20자가 같으면 중복
-        norm_ex = normalize_title(art.get("title", ""))
-        if len(norm_new) >= 15 and len(norm_ex) >= 15:
-            if norm_new[:20] == norm_ex[:20]:
-                return True
-
-    return False
-
-
-# ═══ 티커 → 검색어 매핑 ═══
-TICKER_QUERIES = {
-    "NVDA": "엔비디아", "AVGO": "브로드컴", "ASML": "ASML",
-    "AMD": "AMD", "QCOM": "퀄컴", "TXN": "텍사스인스트루먼트",
-    "ARM": "ARM 반도체", "AMAT": "어플라이드머티리얼즈",
-    "INTC": "인텔 반도체", "ADI": "아날로그디바이시스",
-    "MU": "마이크론", "LRCX": "램리서치", "KLAC": "KLA",
-    "MRVL": "마벨테크놀로지", "NXPI": "NXP반도체", "MCHP": "마이크로칩",
-    "MPWR": "모놀리식파워", "STX": "시게이트", "WDC": "웨스턴디지털",
-    "MSFT": "마이크로소프트", "CSCO": "시스코", "PLTR": "팔란티어",
-    "CDNS": "케이던스", "SNPS": "시놉시스", "ADBE": "어도비",
-    "INTU": "인튜이트", "ADP": "ADP", "WDAY": "워크데이",
-    "DDOG": "데이터독", "VRSK": "버리스크", "CTSH": "코그니전트",
-    "CSGP": "코스타그룹", "PAYX": "페이첵스", "MSTR": "마이크로스트래티지",
-    "PANW": "팔로알토네트웍스", "CRWD": "크라우드스트라이크",
-    "FTNT": "포티넷", "ZS": "지스케일러", "TEAM": "아틀라시안",
-    "ADSK": "오토데스크", "SHOP": "쇼피파이",
-    "ROP": "로퍼테크놀로지스", "TRI": "톰슨로이터",
-    "GOOGL": "구글 알파벳", "META": "메타 페이스북",
-    "NFLX": "넷플릭스", "APP": "앱러빈", "DASH": "도어대시",
-    "EA": "일렉트로닉아츠", "TTWO": "테이크투",
-    "PDD": "핀둬둬 테무", "WBD": "워너브라더스",
-    "CHTR": "차터커뮤니케이션", "CMCSA": "컴캐스트",
-    "AMZN": "아마존", "BKNG": "부킹홀딩스", "MELI": "메르카도리브레",
-    "ABNB": "에어비앤비", "PYPL": "페이팔", "MAR": "메리어트",
-    "ROST": "로스스토어스", "WMT": "월마트",
-    "AAPL": "애플", "COST": "코스트코", "PEP": "펩시코",
-    "TMUS": "T모바일", "SBUX": "스타벅스", "MDLZ": "몬델리즈",
-    "MNST": "몬스터비버리지", "KHC": "크래프트하인즈",
-    "KDP": "큐리그닥터페퍼", "CCEP": "코카콜라유로패시픽",
-    "CEG": "컨스텔레이션에너지", "XEL": "엑셀에너지",
-    "AEP": "아메리칸일렉트릭파워", "EXC": "엑셀론",
-    "ISRG": "인튜이티브서지컬", "AMGN": "암젠", "VRTX": "버텍스제약",
-    "GILD": "길리어드", "REGN": "리제네론", "GEHC": "GE헬스케어",
-    "DXCM": "덱스콤", "IDXX": "아이덱스", "ALNY": "알나일람",
-    "INSM": "인스메드", "LIN": "린데",
-    "TSLA": "테슬라", "HON": "하니웰", "AXON": "액슨엔터프라이즈",
-    "CSX": "CSX", "CPRT": "코파트", "ODFL": "올드도미니언",
-    "FAST": "파스널", "FANG": "다이아몬드백에너지",
-    "BKR": "베이커휴즈", "FER": "페로비알", "PCAR": "팩카",
-    "ORLY": "오라일리오토", "CTAS": "신타스",
-}
-
-
-def search_naver_news(query, display=5):
+    return FILTER.is_financial(title, desc)
+
+
+def search_naver_news(query, display=5, start=1):
     enc = urllib.parse.quote(query)
-    url = f"https://openapi.naver.com/v1/search/news.json?query={enc}&display={display}&sort=date"
-    req = urllib.request.Request(url)
-    req.add_header("X-Naver-Client-Id", CLIENT_ID)
-    req.add_header("X-Naver-Client-Secret", CLIENT_SECRET)
+    url = (f"https://openapi.naver.com/v1/search/news.json?query={enc}"
+           f"&display={display}&start={start}&sort=date")
+    headers = {
+        "X-Naver-Client-Id": CLIENT_ID,
+        "X-Naver-Client-Secret": CLIENT_SECRET,
+    }
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            if resp.getcode() == 200:
-                return json.loads(resp.read().decode("utf-8"))
-    except Exception as e:
+        resp = get_client().get(url, headers=headers, timeout=10,
+                                limiter=naver_limiter(CLIENT_ID, QUOTA_PATH))
+        if resp.status == 200:
+            return resp.json()
+        print(f"  ❌ HTTP {resp.status} searching '{query}'")
+    except QuotaExhausted:
+        pass  # 한도 소진 — 리미터가 한 번만 알림
+    except (RequestError, ValueError) as e:
         print(f"  ❌ Error searching '{query}': {e}")
     return None
 
@@ -201,103 +155,101 @@ def parse_date(date_str):
     return date_str
 
 
-def is_within_retention(date_str, cutoff_date):
-    if not date_str:
-        return True
-    try:
-        if "T" in date_str:
-            dt_str = date_str.split("T")[0]
-            dt = datetime.strptime(dt_str, "%Y-%m-%d")
-        else:
-            dt = parsedate_to_datetime(date_str).replace(tzinfo=None)
-        return dt >= cutoff_date
-    except:
-        return True
-
-
 def extract_mentioned_tickers(title, desc):
-    combined = (title + " " + desc).upper()
-    mentions = set()
-    for ticker in TICKER_QUERIES:
-        if len(ticker) >= 3 and ticker in combined:
-            mentions.add(ticker)
-    combined_kr = title + " " + desc
-    kr_to_ticker = {}
-    for t, q in TICKER_QUERIES.items():
-        for keyword in q.split():
-            if len(keyword) >= 2:
-                kr_to_ticker[keyword] = t
-    for keyword, ticker in kr_to_ticker.items():
-        if keyword in combined_kr:
-            mentions.add(ticker)
-    return list(mentions)
-
-
-def load_existing_news(path):
-    if not os.path.exists(path):
-        print("  📄 기존 news.json 없음 — 새로 생성")
-        return None
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        article_count = sum(len(v) for v in data.get("stocks", {}).values())
-        print(f"  📄 기존 news.json 로드: {article_count}개 기사")
-        return data
-    except Exception as e:
-        print(f"  ⚠️ 기존 news.json 로드 실패: {e}")
-        return None
-
-
-def deduplicate_articles(articles):
-    """기사 목록에서 중복 제거 (URL + 제목)"""
-    seen_urls = set()
-    seen_titles = set()
-    unique = []
-
-    def clean_url(u):
-        return u.split("?")[0].split("#")[0].rstrip("/") if u else ""
+    """언급된 종목 → 관련도 (제목 언급 1.0, 요약 언급 0.5씩)"""
+    return MATCHER.relevance(title, desc)
 
-    for art in articles:
-        url = clean_url(art.get("url", ""))
-        norm_title = normalize_title(art.get("title", ""))[:20]
 
-        # URL 중복
-        if url and url in seen_urls:
-            continue
-        # 제목 앞 20자 중복
-        if len(norm_title) >= 15 and norm_title in seen_titles:
-            continue
+def collect_ticker_news(ticker, query, index, stats, coverage):
+    """한 종목의 오늘 뉴스 수집 → (새 기사 목록, 비경제 필터 제외 수, [(기사, 함께 넣을 종목들)])
 
-        if url:
+    검색어별 통계(stats)로 죽은 검색어는 건너뛰고 display 크기를 정하며, 결과를 다시 기록한다.
+    각 검색어는 지난 실행의 워터마크를 지날 때까지만 페이지를 넘겨 새 결과만 읽는다.
+    다른 종목 검색에서 이미 새 기사가 귀속됐으면(coverage) 그만큼 덜 찾는다 —
+    목표 수를 채웠으면 검색을 건너뛰고, 일부면 기본 검색어 하나만.
+    목표 수는 다음 검색어로 넘어갈지만 정한다 — 한 검색어의 새 결과는 워터마크까지 모두 받는다.
+    """
+    new_articles = []
+    routes = []
+    seen_urls = set()
+    batch_keys = set()  # 이번 검색 결과끼리의 중복 (URL · 제목 키)
+    batch_near = NearDupIndex()  # 이번 검색 결과끼리의 유사 중복 (고쳐 쓴 기사)
+    filtered = 0
+
+    want = 10 - coverage.planned(ticker)
+    if want <= 0:
+        coverage.skip(ticker)
+        return new_articles, filtered, routes
+    planned = stats.plan(ticker, query)
+    if want < 10:
+        planned = planned[:1]
+
+    for q in planned:
+        display = stats.display_for(q, want, 20)
+        crawl = stats.crawl(q, lambda start: search_naver_news(q, display, start), display)
+        examined = passed = added = 0
+        for item in crawl:
+            examined += 1
+            # originallink만 사용 (네이버 링크 차단)
+            url = item.get("originallink", "")
+            if not url or url in seen_urls:
+                continue
+            if not is_allowed_source(url):
+                continue
             seen_urls.add(url)
-        if len(norm_title) >= 15:
-            seen_titles.add(norm_title)
-        unique.append(art)
-
-    return unique
-
-
-def calculate_co_mentions(stocks_data):
-    co_mention_count = {}
-    for ticker, articles in stocks_data.items():
-        for art in articles:
-            tickers_in_article = set(art.get("mentions", []))
-            tickers_in_article.add(ticker)
-            tickers_list = sorted(tickers_in_article)
-            for a_idx in range(len(tickers_list)):
-                for b_idx in range(a_idx + 1, len(tickers_list)):
-                    pair = f"{tickers_list[a_idx]}-{tickers_list[b_idx]}"
-                    co_mention_count[pair] = co_mention_count.get(pair, 0) + 1
-    return {
-        k: v for k, v in sorted(co_mention_count.items(), key=lambda x: -x[1])
-        if v >= 2
-    }
+
+            title = clean_html(item.get("title", ""))
+            desc = clean_html(item.get("description", ""))
+
+            # 비경제 뉴스 필터
+            if not is_financial_news(title, desc):
+                filtered += 1
+                continue
+            passed += 1
+
+            # 기존 기사와 중복 체크 (인덱스 조회)
+            if index.is_duplicate(ticker, title, url, desc):
+                continue
+            keys = article_keys(title, url)
+            if any(k and k in batch_keys for k in keys):
+                continue
+            if batch_near.find(title, desc, url) is not None:
+                continue
+            batch_keys.update(k for k in keys if k)
+            batch_near.add(ticker, {"title": title, "desc": desc, "url": url})
+
+            scores = extract_mentioned_tickers(title, desc)
+            pub_date = parse_date(item.get("pubDate", ""))
+
+            new_articles.append({
+                "title": title,
+                "desc": desc[:200],
+                "url": url,
+                "date": pub_date,
+                "ts": parse_timestamp(pub_date) or int(datetime.now(timezone.utc).timestamp()),
+                "mentions": sorted(scores),
+            })
+            added += 1
+
+            # 관련도가 충분한 다른 언급 종목에도 귀속 (그 종목에 이미 있으면 제외)
+            targets = [t for t in coverage.targets(ticker, scores)
+                       if not index.is_duplicate(t, title, url, desc)]
+            if targets:
+                routes.append((new_articles[-1], targets))
+        # 목표 수를 넘어도 워터마크까지 끝까지 읽는다 (중간에 멈추면 워터마크가 못 움직임)
+        stats.record(q, crawl, examined, passed, added)
+
+        if len(new_articles) >= want:
+            break
+
+    return new_articles, filtered, routes
 
 
 def main():
     kst = timezone(timedelta(hours=9))
     now = datetime.now(kst)
-    cutoff_date = (now - timedelta(days=RETENTION_DAYS)).replace(tzinfo=None)
+    cutoff_date = now - timedelta(days=RETENTION_DAYS)
+    cutoff_ts = int(cutoff_date.timestamp())
 
     print(f"🚀 뉴스 수집 시작: {now.strftime('%Y-%m-%d %H:%M KST')}")
     print(f"   총 {len(TICKER_QUERIES)}개 종목")
@@ -306,27 +258,37 @@ def main():
     # ═══ 1. 기존 데이터 로드 ═══
     out_path = os.path.join(os.path.dirname(__file__), "..", "data", "news.json")
     out_path = os.path.abspath(out_path)
-    existing = load_existing_news(out_path)
-    existing_stocks = existing.get("stocks", {}) if existing else {}
+    data_dir = os.path.dirname(out_path)
+    store = NewsStore.load(data_dir)
+    existing_stocks = store.expand()
 
     # ═══ 2. 기존 데이터에서 먼저 중복 제거 + 비경제 뉴스 정리 ═══
     print(f"\n🧹 기존 데이터 정리 중...")
     cleaned_count = 0
+    revalidated = 0
+    # 종목 목록별 검증 규칙 버전 (기사는 여러 종목 목록이 공유하므로 목록 단위로 기록)
+    validated = store.meta.get("validated", {})
     for ticker in list(existing_stocks.keys()):
-        before = len(existing_stocks[ticker])
-        # 비경제 뉴스 제거
-        existing_stocks[ticker] = [
-            a for a in existing_stocks[ticker]
-            if is_financial_news(a.get("title", ""), a.get("desc", ""))
-        ]
-        # 중복 제거
-        existing_stocks[ticker] = deduplicate_articles(existing_stocks[ticker])
-        # 90일 초과 제거
-        existing_stocks[ticker] = [
-            a for a in existing_stocks[ticker]
-            if is_within_retention(a.get("date"), cutoff_date)
-        ]
+        articles = existing_stocks[ticker]
+        before = len(articles)
+        # 규칙이 바뀌었거나 검증 기록이 없는 종목만 비경제/중복 재검사
+        if validated.get(ticker) != VALIDATION_VERSION:
+            articles = [
+                a for a in articles
+                if is_financial_news(a.get("title", ""), a.get("desc", ""))
+            ]
+            articles = deduplicate_articles(articles)
+            for a in articles:
+                a.pop("v", None)  # 예전 형식의 기사별 버전
+                # 매칭 규칙이 바뀌었을 수 있으므로 언급 종목 다시 태깅
+                a["mentions"] = sorted(extract_mentioned_tickers(a.get("title", ""), a.get("desc", "")))
+            revalidated += 1
+        # 보관 기간 초과 제거 (항상) — 목록이 ts 최신순이라 경계를 이분 탐색해 뒤를 잘라냄
+        prune_before(articles, cutoff_ts)
+        existing_stocks[ticker] = articles
         cleaned_count += before - len(existing_stocks[ticker])
+    if revalidated:
+        print(f"  🔁 규칙 {VALIDATION_VERSION}로 재검사: {revalidated}개 종목")
     if cleaned_count > 0:
         print(f"  🗑️ {cleaned_count}개 기사 정리됨 (중복/비경제/만료)")
 
@@ -335,68 +297,82 @@ def main():
     today_new_count = 0
     today_filtered_count = 0
 
-    for i, (ticker, query) in enumerate(TICKER_QUERIES.items()):
+    # 정리된 기존 기사로 중복 인덱스를 한 번 만들고, 새 기사는 추가하며 갱신
+    index = DedupeIndex.build(existing_stocks)
+    touched = set()  # 이번 실행에서 종목 목록에 추가된 기사 id
+    stats = QueryStats.load(os.path.join(data_dir, STATS_FILENAME))
+    routed_count = 0
+    # 이번 실행에서 다른 종목 검색을 통해 들어온 새 기사 수 (관련도 기준 이상만 귀속)
+    coverage = Coverage(TICKER_QUERIES)
+
+    # 종목별 검색은 엔진에서 병렬로(host 한도만큼씩 묶어), 병합 · 귀속은 티커 순서대로
+    jobs = coverage.imap(
+        get_engine(),
+        lambda tq: collect_ticker_news(tq[0], tq[1], index, stats, coverage),
+        list(TICKER_QUERIES.items()),
+        NAVER_HOST,
+    )
+    for i, ((ticker, query), (new_articles, filtered, routes)) in enumerate(jobs):
         if (i + 1) % 10 == 0 or i == 0:
             print(f"  [{i+1:3d}/{len(TICKER_QUERIES)}] {ticker}: '{query}'")
 
-        new_articles = []
-        seen_urls = set()
-
-        for q in [query, f"{ticker} 주가"]:
-            result = search_naver_news(q, display=20)
-            if result and "items" in result:
-                for item in result["items"]:
-                    # originallink만 사용 (네이버 링크 차단)
-                    url = item.get("originallink", "")
-                    if not url or url in seen_urls:
-                        continue
-                    if not is_allowed_source(url):
-                        continue
-                    seen_urls.add(url)
-
-                    title = clean_html(item.get("title", ""))
-                    desc = clean_html(item.get("description", ""))
-
-                    # 비경제 뉴스 필터
-                    if not is_financial_news(title, desc):
-                        today_filtered_count += 1
-                        continue
-
-                    # 기존 기사와 중복 체크
-                    if is_duplicate(title, url, existing_stocks.get(ticker, [])):
-                        continue
-
-                    mentioned = extract_mentioned_tickers(title, desc)
-                    pub_date = parse_date(item.get("pubDate", ""))
-
-                    new_articles.append({
-                        "title": title,
-                        "desc": desc[:200],
-                        "url": url,
-                        "date": pub_date,
-                        "mentions": mentioned,
-                    })
-
-                    if len(new_articles) >= 10:
-                        break
-
-            if len(new_articles) >= 10:
-                break
-            time.sleep(0.05)
-
+        # 같은 실행에서 다른 종목 검색이 먼저 귀속한 기사는 제외
+        new_articles = [a for a in new_articles
+                        if not index.is_duplicate(ticker, a["title"], a["url"], a["desc"])]
+        today_filtered_count += filtered
         today_new_count += len(new_articles)
 
-        # 기존 기사 앞에 새 기사 추가 (최신 먼저)
-        combined = new_articles + existing_stocks.get(ticker, [])
-        existing_stocks[ticker] = deduplicate_articles(combined)
-
-    # ═══ 4. co-mention 전체 재계산 ═══
-    print(f"\n🔗 co-mention 재계산 중...")
-    co_mentions = calculate_co_mentions(existing_stocks)
+        # 새 기사와 기존 기사를 ts 최신순으로 병합 — 인덱스로 이미 중복 제거됨
+        for art in new_articles:
+            index.add(ticker, art)
+            touched.add(article_id(art))
+        existing_stocks[ticker] = sort_by_time(new_articles + existing_stocks.get(ticker, []))
+
+        # 언급된 다른 종목에도 같은 기사 추가
+        for art, targets in routes:
+            for t in targets:
+                if index.is_duplicate(t, art["title"], art["url"], art["desc"]):
+                    continue
+                index.add(t, art)
+                touched.add(article_id(art))
+                insert_by_time(existing_stocks.setdefault(t, []), art)
+                coverage.credit([t])
+                routed_count += 1
+
+    # 오늘 사용한 네이버 호출 수 기록 (다음 작업이 이어서 셈)
+    quota = naver_limiter(CLIENT_ID, QUOTA_PATH).quota
+    quota.save()
+    naver_calls = quota.taken
+    print(f"  📈 네이버 호출 {naver_calls}회 (오늘 {quota.used}/{quota.limit}회)")
+    stats.save()
+    print(f"  🔀 교차 귀속 {routed_count}건 (자체 검색 생략 {len(coverage.skipped)}개 종목)")
+    dead, total_queries = stats.summary()
+    if today_new_count + routed_count:
+        print(f"  🎯 새 기사 1개당 호출 {naver_calls / (today_new_count + routed_count):.2f}회 "
+              f"(죽은 검색어 {dead}/{total_queries}개)")
+
+    # ═══ 4. co-mention 증분 집계 ═══
+    print(f"\n🔗 co-mention 증분 집계 중...")
+    # 종목별 기사 목록 → 정규화 (같은 기사는 한 번만 저장)
+    store = NewsStore.from_stocks(existing_stocks)
+    # 일별 버킷: 사라진 기사 빼고, 이번에 추가된 기사만 더한 뒤 보관 기간 밖 버킷 삭제
+    buckets = CoMentionBuckets.load(os.path.join(data_dir, BUCKETS_FILENAME))
+    buckets.sync(store, touched, now.strftime("%Y-%m-%d"), full=revalidated > 0)
+    buckets.expire(cutoff_date.strftime("%Y-%m-%d"))
+    buckets.save()
+    co_mentions = buckets.totals()
+
+    # 연관도(NPMI · Jaccard · lift) + 시간 감쇠 가중치 → 종목당 상위 k개 엣지
+    owners = article_tickers(store)
+    co_mention_edges = co_mention_graph(
+        [(store.articles[aid], tickers) for aid, tickers in owners.items()], now)
 
     # ═══ 5. 통계 ═══
     total_articles = sum(len(v) for v in existing_stocks.values())
     tickers_with_news = sum(1 for v in existing_stocks.values() if len(v) > 0)
+    # 최근 24시간 기사 (종목별 목록 앞부분만 봄)
+    day_ago = int(now.timestamp()) - 86400
+    recent_24h = len({aid for t in store.stocks for aid in store.ids_since(t, day_ago)})
 
     # ═══ 6. 저장 ═══
     news_data = {
@@ -405,25 +381,39 @@ def main():
         "retention_days": RETENTION_DAYS,
         "stats": {
             "total_articles": total_articles,
+            "unique_articles": len(store.articles),
             "tickers_with_news": tickers_with_news,
             "today_new": today_new_count,
             "today_filtered": today_filtered_count,
+            "recent_24h": recent_24h,
+            "naver_calls": naver_calls,
+            "dead_queries": dead,
+            "routed": routed_count,
             "co_mention_pairs": len(co_mentions),
+            "co_mention_edges": len(co_mention_edges["edges"]),
         },
-        "stocks": existing_stocks,
-        "co_mentions": co_mentions,
+        "co_mention_edges": co_mention_edges,
     }
 
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(news_data, f, ensure_ascii=False, indent=1)
-
-    file_size = os.path.getsize(out_path) / 1024
+    # 정규화 원본(news_store.json.gz, 희소 엣지 목록 — 수집기만 읽으므로 gzip 하나)
+    # + 기존 형식 호환본(news.json — 화면이 읽는 파일, 들여쓰기 JSON 하나만)
+    # 남은 목록은 모두 현재 규칙으로 검증됨 (새 기사는 수집 시 같은 규칙을 통과)
+    validated = {t: VALIDATION_VERSION for t in store.stocks}
+    store_entry = publish_gzip(store.to_dict({**news_data, "validated": validated}),
+                               data_dir, STORE_FILENAME, manifest_name=NEWS_MANIFEST_FILENAME)
+    # 전체 쌍 건수(co_mentions)는 기존 지도 호환용으로 news.json에만
+    legacy = store.export_legacy({**news_data, "co_mentions": co_mentions})
+    entry = publish_json(legacy, data_dir, os.path.basename(out_path), indent=1,
+                         manifest_name=NEWS_MANIFEST_FILENAME, variants=False)
+
+    file_size = entry["bytes"] / 1024
     print(f"\n✅ 완료!")
     print(f"   오늘 수집: {today_new_count}개 (필터링 제외: {today_filtered_count}개)")
     print(f"   전체 누적: {total_articles}개 ({tickers_with_news}개 종목)")
     print(f"   co-mention 쌍: {len(co_mentions)}개")
     print(f"   파일 크기: {file_size:.1f} KB")
+    print(f"   {STORE_FILENAME}: 기사 {len(store.articles)}개, "
+          f"{store_entry['bytes'] / 1024:.1f} KB ({describe(store_entry)})")
 
     top = list(co_mentions.items())[:15]
     if top:
@@ -431,9 +421,14 @@ def main():
         for pair, count in top:
             print(f"   {pair}: {count}건")
 
-
-if __name__ == "__main__":
-    main()
+    fields = co_mention_edges["fields"]
+    score = co_mention_edges["score"]
+    if co_mention_edges["edges"]:
+        print(f"\n🧭 연관도 TOP 15 ({score}, 종목당 상위 {co_mention_edges['top_k']}개 → "
+              f"엣지 {len(co_mention_edges['edges'])}개):")
+        for edge in co_mention_edges["edges"][:15]:
+            row = dict(zip(fields, edge))
+            print(f"   {row['source']}-{row['target']}: {score} {row[score]} ({row['count']}건)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,212 @@
+"""
+AI MESH — 공용 HTTP 클라이언트 (keep-alive 커넥션 풀)
+호스트별로 열린 HTTPS 연결을 재사용해 매 호출마다 TLS 핸드셰이크를 하지 않는다.
+
+- 호스트별 커넥션 풀 (스레드 안전, fetch_engine 병렬 호출 대응)
+- 호출별 timeout
+- gzip / deflate 응답 자동 해제
+- 연결 오류 · 타임아웃 · 잘리거나 깨진 압축 본문 · 429 · 5xx 재시도 (지수 백오프, 429는 Retry-After 우선)
+- limiter(rate_limiter.TokenBucket)를 넘기면 매 시도 전에 토큰을 받는다
+
+네트워크 오류로 끝내 실패하면 RequestError, HTTP 오류 코드는 Response.status로 돌려준다.
+"""
+
+import gzip
+import json
+import time
+import zlib
+import queue
+import random
+import threading
+import http.client
+import urllib.parse
+
+from rate_limiter import parse_retry_after
+
+USER_AGENT = "AI-MESH/1.0"
+DEFAULT_TIMEOUT = 15
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+POOL_SIZE = 8
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# 재시도할 전송 오류 — 압축 해제 실패(EOFError, zlib.error, gzip.BadGzipFile ⊂ OSError) 포함
+RETRY_ERRORS = (OSError, http.client.HTTPException, EOFError, zlib.error)
+
+
+class RequestError(Exception):
+    """재시도 후에도 응답을 받지 못한 경우"""
+
+
+class Response:
+    def __init__(self, status, headers, body, url):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.url = url
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    def text(self, encoding="utf-8"):
+        return self.body.decode(encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.body.decode("utf-8"))
+
+
+def _decode_body(body, encoding):
+    encoding = (encoding or "").lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+class HttpClient:
+    def __init__(self, timeout=DEFAULT_TIMEOUT, max_retries=DEFAULT_RETRIES,
+                 backoff=DEFAULT_BACKOFF, pool_size=POOL_SIZE):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self._pools = {}  # (scheme, host, port) → Queue[HTTPConnection]
+        self._lock = threading.Lock()
+
+    # ─── 커넥션 풀 ───
+    def _pool(self, key):
+        with self._lock:
+            if key not in self._pools:
+                self._pools[key] = queue.LifoQueue(maxsize=self.pool_size)
+            return self._pools[key]
+
+    def _connect(self, key, timeout):
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, port, timeout=timeout)
+
+    def _checkout(self, key, timeout):
+        """(연결, 재사용 여부)"""
+        try:
+            conn = self._pool(key).get_nowait()
+        except queue.Empty:
+            return self._connect(key, timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _checkin(self, key, conn):
+        try:
+            self._pool(key).put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self):
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+    # ─── 요청 ───
+    def _send(self, key, path, headers, timeout):
+        conn, reused = self._checkout(key, timeout)
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+            # 서버가 먼저 닫은 keep-alive 연결 — 새 연결로 한 번 더 (재시도 횟수 미차감)
+            conn = self._connect(key, timeout)
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except Exception:
+                conn.close()
+                raise
+        except Exception:
+            conn.close()
+            raise
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return resp.status, resp.headers, body
+
+    def get(self, url, headers=None, timeout=None, limiter=None):
+        """GET → Response (재시도 대상 오류가 계속되면 마지막 응답 또는 RequestError)"""
+        parts = urllib.parse.urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        req_headers = {
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+        req_headers.update(headers or {})
+        timeout = timeout or self.timeout
+
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                status, resp_headers, body = self._send(key, path, req_headers, timeout)
+                body = _decode_body(body, resp_headers.get("Content-Encoding"))
+            except RETRY_ERRORS as e:
+                last_error = e
+                if attempt < self.max_retries:
+                    time.sleep(self._backoff_delay(attempt))
+                    continue
+                raise RequestError(f"{parts.hostname}: {e}") from e
+
+            response = Response(status, resp_headers, body, url)
+            if status not in RETRY_STATUSES or attempt >= self.max_retries:
+                return response
+
+            if status == 429 or resp_headers.get("Retry-After"):
+                delay = parse_retry_after(resp_headers.get("Retry-After"),
+                                          default=self._backoff_delay(attempt))
+            else:
+                delay = self._backoff_delay(attempt)
+            print(f"    HTTP {status} ({parts.hostname}) — {delay:.1f}초 후 재시도")
+            if limiter is not None:
+                limiter.block_for(delay)
+            else:
+                time.sleep(delay)
+
+        raise RequestError(f"{parts.hostname}: {last_error}")
+
+    def _backoff_delay(self, attempt):
+        return self.backoff * (2 ** attempt) * (0.5 + random.random() / 2)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """프로세스 전체가 공유하는 클라이언트"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
@@ -0,0 +1,223 @@
+"""
+AI MESH — 뉴스 중복 인덱스
+기존 기사의 정규화 URL · 제목 키를 해시 집합으로 들고 있어
+새 기사마다 보관 기사 전체를 훑지 않고 O(1)로 중복 여부를 확인한다.
+
+중복 기준:
+  - URL: 쿼리스트링 · 앵커 · 끝 슬래시를 뗀 값이 같으면 중복
+  - 제목: 정규화한 제목이 15자 이상이고 앞 20자가 같으면 중복
+  - 유사 중복: 같은 통신 기사를 언론사마다 고쳐 쓴 기사 — 제목+요약의 한글 3-gram
+    Jaccard 유사도가 NEWS_NEAR_DUP_THRESHOLD(기본 0.6) 이상이고, 제목끼리도
+    NEAR_DUP_TITLE_MIN 이상 겹치면 중복 (NearDupIndex)
+
+실행마다 정리된 news.json으로 한 번 만들고, 새 기사를 종목 목록에 넣을 때 add로 갱신한다.
+티커별 집합만 유지한다 (중복 여부는 항상 종목 단위로 묻는다).
+
+유사 중복은 MinHash 서명을 LSH 밴드로 나눠 버킷에 넣고, 같은 버킷에 걸린 후보만
+실제 Jaccard로 확인한다 — 새 기사 하나를 보관 기사 전체와 비교하지 않는다.
+numpy가 있으면 서명 계산을 벡터 연산으로 (결과는 같음).
+"""
+
+import re
+import zlib
+import random
+from functools import lru_cache
+from env_config import env_number
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TITLE_KEY_MIN = 15
+TITLE_KEY_LEN = 20
+
+DEFAULT_NEAR_DUP_THRESHOLD = 0.6
+SHINGLE_LEN = 3       # 글자 n-gram 길이
+MIN_SHINGLES = 8      # 이보다 짧은 글은 유사 중복 비교 안 함
+LSH_BANDS = 16        # 밴드 16 × 행 3 = 서명 48개 → 유사도 0.6에서 후보 재현율 ~98%
+LSH_ROWS = 3
+NEAR_DUP_TITLE_MIN = 0.2  # 제목끼리도 이만큼은 겹쳐야 함 (요약이 같은 묶음 기사 · 목록 페이지 오탐 방지)
+
+
+def near_dup_threshold():
+    return env_number("NEWS_NEAR_DUP_THRESHOLD", DEFAULT_NEAR_DUP_THRESHOLD, minimum=0.0, maximum=1.0)
+
+
+NEAR_DUP_THRESHOLD = near_dup_threshold()
+
+# 중복 규칙 버전 — 규칙을 바꾸면 저장 기사들이 다시 검사된다
+DEDUPE_VERSION = f"2.{TITLE_KEY_MIN}.{TITLE_KEY_LEN}.{NEAR_DUP_THRESHOLD:g}.{NEAR_DUP_TITLE_MIN:g}"
+
+_TITLE_STRIP_RE = re.compile(r"[^\w가-힣]")
+
+# MinHash 해시 함수 (a·x + b) mod 2^64 의 상위 32비트 — 실행마다 같은 값이 되도록 고정 시드
+_rng = random.Random(20260504)
+_HASH_A = [_rng.getrandbits(64) | 1 for _ in range(LSH_BANDS * LSH_ROWS)]
+_HASH_B = [_rng.getrandbits(64) for _ in range(LSH_BANDS * LSH_ROWS)]
+_MASK64 = (1 << 64) - 1
+
+
+def normalize_title(title):
+    """제목 정규화 — 중복 비교용"""
+    return _TITLE_STRIP_RE.sub("", title or "").lower()
+
+
+def canonical_url(url):
+    """URL 정규화 (파라미터 · 앵커 · 끝 슬래시 제거)"""
+    return url.split("?")[0].split("#")[0].rstrip("/") if url else ""
+
+
+def title_key(title):
+    """제목 중복 키 — 너무 짧은 제목은 None (비교하지 않음)"""
+    norm = normalize_title(title)
+    return norm[:TITLE_KEY_LEN] if len(norm) >= TITLE_KEY_MIN else None
+
+
+def article_keys(title, url):
+    return canonical_url(url), title_key(title)
+
+
+def shingles(title, desc=""):
+    """제목+요약의 글자 n-gram 해시 집합 (공백 · 기호 제거 후)"""
+    text = normalize_title(f"{title}{desc}")
+    return frozenset(zlib.crc32(text[i:i + SHINGLE_LEN].encode("utf-8"))
+                     for i in range(len(text) - SHINGLE_LEN + 1))
+
+
+def minhash(hashes):
+    """n-gram 해시 집합 → MinHash 서명 (LSH_BANDS × LSH_ROWS개)"""
+    if np is not None:
+        h = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+        a = np.asarray(_HASH_A, dtype=np.uint64)[:, None]
+        b = np.asarray(_HASH_B, dtype=np.uint64)[:, None]
+        with np.errstate(over="ignore"):
+            return tuple(((a * h + b) >> np.uint64(32)).min(axis=1).tolist())
+    # 상위 32비트 추출은 단조 함수이므로 최솟값을 먼저 구한 뒤 한 번만 민다
+    return tuple(min([(a * x + b) & _MASK64 for x in hashes]) >> 32
+                 for a, b in zip(_HASH_A, _HASH_B))
+
+
+@lru_cache(maxsize=65536)
+def fingerprint(title, desc=""):
+    """(제목+요약 n-gram 집합, MinHash 서명, 제목 n-gram 집합) — 짧은 글은 None.
+    같은 기사가 여러 종목 · 단계에서 반복 비교되므로 프로세스 안에서 캐시한다."""
+    grams = shingles(title, desc)
+    if len(grams) < MIN_SHINGLES:
+        return None
+    return grams, minhash(grams), shingles(title)
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+class NearDupIndex:
+    """MinHash + LSH 유사 중복 인덱스 (기사 키별로 그 기사를 가진 종목 유지)"""
+
+    def __init__(self, threshold=None):
+        self.threshold = NEAR_DUP_THRESHOLD if threshold is None else threshold
+        self.entries = {}  # key → fingerprint()
+        self.owners = {}   # key → {ticker}
+        self.buckets = {}  # (밴드 번호, 밴드 값) → {key}
+
+    @staticmethod
+    def _bands(sig):
+        for band in range(LSH_BANDS):
+            yield band, sig[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+
+    @staticmethod
+    def _key(title, url):
+        return canonical_url(url) or normalize_title(title)
+
+    def add(self, ticker, article):
+        title, desc = article.get("title", ""), article.get("desc", "")
+        key = self._key(title, article.get("url", ""))
+        if key not in self.entries:
+            fp = fingerprint(title, desc)
+            if fp is None:
+                return
+            self.entries[key] = fp
+            for band in self._bands(fp[1]):
+                self.buckets.setdefault(band, set()).add(key)
+        self.owners.setdefault(key, set()).add(ticker)
+
+    def find(self, title, desc="", url="", ticker=None):
+        """유사도 threshold 이상인 다른 기사 키 (ticker를 주면 그 종목 기사 중에서만), 없으면 None"""
+        fp = fingerprint(title, desc)
+        if fp is None:
+            return None
+        grams, sig, title_grams = fp
+        own = self._key(title, url)
+        seen = set()
+        for band in self._bands(sig):
+            for key in tuple(self.buckets.get(band, ())):
+                if key == own or key in seen:
+                    continue
+                seen.add(key)
+                if ticker is not None and ticker not in self.owners.get(key, ()):
+                    continue
+                entry = self.entries.get(key)
+                if (entry and jaccard(grams, entry[0]) >= self.threshold
+                        and jaccard(title_grams, entry[2]) >= NEAR_DUP_TITLE_MIN):
+                    return key
+        return None
+
+
+class DedupeIndex:
+    def __init__(self):
+        self.by_ticker = {}  # ticker → ({url}, {title_key})
+        self.near = NearDupIndex()
+
+    @classmethod
+    def build(cls, stocks):
+        """{ticker: [article, ...]} → 인덱스"""
+        index = cls()
+        for ticker, articles in stocks.items():
+            for art in articles:
+                index.add(ticker, art)
+        return index
+
+    def _sets(self, ticker):
+        if ticker not in self.by_ticker:
+            self.by_ticker[ticker] = (set(), set())
+        return self.by_ticker[ticker]
+
+    def add(self, ticker, article):
+        url, key = article_keys(article.get("title", ""), article.get("url", ""))
+        urls, titles = self._sets(ticker)
+        if url:
+            urls.add(url)
+        if key:
+            titles.add(key)
+        self.near.add(ticker, article)
+
+    def is_duplicate(self, ticker, title, url, desc=""):
+        """해당 종목에 이미 있는 기사(또는 그 기사를 고쳐 쓴 유사 기사)인지"""
+        canon, key = article_keys(title, url)
+        urls, titles = self.by_ticker.get(ticker, ((), ()))
+        if (canon and canon in urls) or (key and key in titles):
+            return True
+        return self.near.find(title, desc, url, ticker) is not None
+
+
+def deduplicate_articles(articles):
+    """기사 목록에서 중복 제거 (URL + 제목 + 유사 중복) — 앞쪽(최신) 기사를 남긴다"""
+    seen_urls = set()
+    seen_titles = set()
+    near = NearDupIndex()
+    unique = []
+    for art in articles:
+        title, url = art.get("title", ""), art.get("url", "")
+        canon, key = article_keys(title, url)
+        if (canon and canon in seen_urls) or (key and key in seen_titles):
+            continue
+        if near.find(title, art.get("desc", ""), url) is not None:
+            continue
+        near.add(None, art)
+        if canon:
+            seen_urls.add(canon)
+        if key:
+            seen_titles.add(key)
+        unique.append(art)
+    return unique
@@ -0,0 +1,65 @@
+"""
+AI MESH — 경제 뉴스 관련성 필터 (컴파일된 규칙)
+제외 키워드 · 경제 키워드를 하나의 정규식으로 합쳐
+제목+요약을 한 번 훑는 동안 두 종류의 적중 수를 함께 센다.
+키워드가 수백 개로 늘어도 기사당 비용은 목록 길이에 비례해 늘지 않는다.
+
+판정 규칙 (기존 is_financial_news와 동일):
+  - 제외 키워드가 2종류 이상 → 제외
+  - 제외 키워드가 1종류 → 경제 키워드가 하나라도 있어야 통과
+
+기존처럼 키워드마다 부분 문자열 포함 여부를 보므로, 겹치거나 포개진 키워드도 모두 센다
+(예: "출연준"의 "출연"과 "연준"). 정규식은 전방 탐색으로 위치마다 가장 긴 키워드를 찾고,
+그 키워드 안에 들어 있는 다른 키워드는 미리 구한 포함 관계로 더한다.
+양쪽 목록에 다 있는 키워드는 양쪽에서 센다.
+
+규칙 버전(version)은 RULES_VERSION과 키워드 목록의 해시로 정해진다.
+키워드를 고치면 버전이 자동으로 바뀌므로, 저장된 기사의 재검증 여부 판단에 쓸 수 있다.
+"""
+
+import re
+import hashlib
+
+from ticker_matcher import trie_pattern
+
+# 판정 로직 자체를 바꿀 때 올린다 (키워드 변경은 해시로 자동 반영)
+RULES_VERSION = 2
+
+EXCLUDE = "exclude"
+FINANCE = "finance"
+
+
+class RelevanceFilter:
+    def __init__(self, exclude_keywords, finance_keywords):
+        self.categories = {}  # 키워드 → {분류}
+        for kw in finance_keywords:
+            self.categories.setdefault(kw, set()).add(FINANCE)
+        for kw in exclude_keywords:
+            self.categories.setdefault(kw, set()).add(EXCLUDE)
+        # 키워드 → 그 안에 들어 있는 키워드 (자기 자신 포함)
+        self.contains = {kw: {other for other in self.categories if other in kw} for kw in self.categories}
+        self.pattern = (re.compile("(?=(%s))" % trie_pattern(self.categories))
+                        if self.categories else None)
+
+        digest = hashlib.sha256("\n".join(
+            f"{cat}:{kw}" for kw, cats in sorted(self.categories.items()) for cat in sorted(cats)
+        ).encode("utf-8")).hexdigest()
+        self.version = f"{RULES_VERSION}.{digest[:8]}"
+
+    def scan(self, title, desc=""):
+        """(제외 키워드 종류 수, 경제 키워드 종류 수) — 한 번의 스캔"""
+        if self.pattern is None:
+            return 0, 0
+        found = set()
+        for kw in set(self.pattern.findall(f"{title} {desc}")):
+            found |= self.contains[kw]
+        exclude = sum(1 for kw in found if EXCLUDE in self.categories[kw])
+        return exclude, sum(1 for kw in found if FINANCE in self.categories[kw])
+
+    def is_financial(self, title, desc=""):
+        exclude, finance = self.scan(title, desc)
+        if exclude >= 2:
+            return False
+        if exclude >= 1 and not finance:
+            return False
+        return True
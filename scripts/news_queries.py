@@ -0,0 +1,117 @@
+"""
+AI MESH — 종목별 네이버 뉴스 검색어 (한글 회사명)
+뉴스 검색과 기사 본문의 종목 언급 추출(ticker_matcher)이 함께 쓰는 별칭 테이블.
+"""
+
+# ═══ NASDAQ 100 티커 → 검색어 매핑 ═══
+NASDAQ100_QUERIES = {
+    "NVDA": "엔비디아", "AVGO": "브로드컴", "ASML": "ASML",
+    "AMD": "AMD", "QCOM": "퀄컴", "TXN": "텍사스인스트루먼트",
+    "ARM": "ARM 반도체", "AMAT": "어플라이드머티리얼즈",
+    "INTC": "인텔 반도체", "ADI": "아날로그디바이시스",
+    "MU": "마이크론", "LRCX": "램리서치", "KLAC": "KLA",
+    "MRVL": "마벨테크놀로지", "NXPI": "NXP반도체", "MCHP": "마이크로칩",
+    "MPWR": "모놀리식파워", "STX": "시게이트", "WDC": "웨스턴디지털",
+    "MSFT": "마이크로소프트", "CSCO": "시스코", "PLTR": "팔란티어",
+    "CDNS": "케이던스", "SNPS": "시놉시스", "ADBE": "어도비",
+    "INTU": "인튜이트", "ADP": "ADP", "WDAY": "워크데이",
+    "DDOG": "데이터독", "VRSK": "버리스크", "CTSH": "코그니전트",
+    "CSGP": "코스타그룹", "PAYX": "페이첵스", "MSTR": "마이크로스트래티지",
+    "PANW": "팔로알토네트웍스", "CRWD": "크라우드스트라이크",
+    "FTNT": "포티넷", "ZS": "지스케일러", "TEAM": "아틀라시안",
+    "ADSK": "오토데스크", "SHOP": "쇼피파이",
+    "ROP": "로퍼테크놀로지스", "TRI": "톰슨로이터",
+    "GOOGL": "구글 알파벳", "META": "메타 페이스북",
+    "NFLX": "넷플릭스", "APP": "앱러빈", "DASH": "도어대시",
+    "EA": "일렉트로닉아츠", "TTWO": "테이크투",
+    "PDD": "핀둬둬 테무", "WBD": "워너브라더스",
+    "CHTR": "차터커뮤니케이션", "CMCSA": "컴캐스트",
+    "AMZN": "아마존", "BKNG": "부킹홀딩스", "MELI": "메르카도리브레",
+    "ABNB": "에어비앤비", "PYPL": "페이팔", "MAR": "메리어트",
+    "ROST": "로스스토어스", "WMT": "월마트",
+    "AAPL": "애플", "COST": "코스트코", "PEP": "펩시코",
+    "TMUS": "T모바일", "SBUX": "스타벅스", "MDLZ": "몬델리즈",
+    "MNST": "몬스터비버리지", "KHC": "크래프트하인즈",
+    "KDP": "큐리그닥터페퍼", "CCEP": "코카콜라유로패시픽",
+    "CEG": "컨스텔레이션에너지", "XEL": "엑셀에너지",
+    "AEP": "아메리칸일렉트릭파워", "EXC": "엑셀론",
+    "ISRG": "인튜이티브서지컬", "AMGN": "암젠", "VRTX": "버텍스제약",
+    "GILD": "길리어드", "REGN": "리제네론", "GEHC": "GE헬스케어",
+    "DXCM": "덱스콤", "IDXX": "아이덱스", "ALNY": "알나일람",
+    "INSM": "인스메드", "LIN": "린데",
+    "TSLA": "테슬라", "HON": "하니웰", "AXON": "액슨엔터프라이즈",
+    "CSX": "CSX", "CPRT": "코파트", "ODFL": "올드도미니언",
+    "FAST": "파스널", "FANG": "다이아몬드백에너지",
+    "BKR": "베이커휴즈", "FER": "페로비알", "PCAR": "팩카",
+    "ORLY": "오라일리오토", "CTAS": "신타스",
+}
+
+
+# ═══ S&P 500 주요 종목 → 검색어 매핑 (한국 뉴스 노출 높은 ~150개) ═══
+SP500_QUERIES = {
+    # 빅테크
+    "NVDA": "엔비디아", "AAPL": "애플", "MSFT": "마이크로소프트",
+    "GOOGL": "구글 알파벳", "META": "메타 페이스북", "AMZN": "아마존",
+    "TSLA": "테슬라", "NFLX": "넷플릭스", "AVGO": "브로드컴",
+    "ORCL": "오라클", "CRM": "세일즈포스", "IBM": "IBM",
+    "CSCO": "시스코", "PLTR": "팔란티어", "ADBE": "어도비",
+    "INTU": "인튜이트", "NOW": "서비스나우", "ACN": "액센추어",
+    # 반도체
+    "AMD": "AMD", "INTC": "인텔 반도체", "QCOM": "퀄컴",
+    "TXN": "텍사스인스트루먼트", "AMAT": "어플라이드머티리얼즈",
+    "LRCX": "램리서치", "KLAC": "KLA", "MU": "마이크론",
+    "ADI": "아날로그디바이시스", "NXPI": "NXP반도체", "MCHP": "마이크로칩",
+    "ANET": "아리스타네트웍스", "DELL": "델테크놀로지",
+    # 사이버보안/클라우드
+    "CRWD": "크라우드스트라이크", "PANW": "팔로알토네트웍스",
+    "FTNT": "포티넷", "DDOG": "데이터독", "WDAY": "워크데이",
+    "SNPS": "시놉시스", "CDNS": "케이던스", "ADSK": "오토데스크",
+    # 금융
+    "JPM": "JP모건", "GS": "골드만삭스", "MS": "모건스탠리",
+    "BAC": "뱅크오브아메리카", "WFC": "웰스파고", "C": "씨티그룹",
+    "V": "비자", "MA": "마스터카드", "AXP": "아메리칸익스프레스",
+    "BLK": "블랙록", "SCHW": "찰스슈왑", "COF": "캐피탈원",
+    "PYPL": "페이팔", "COIN": "코인베이스", "HOOD": "로빈후드",
+    "BX": "블랙스톤", "KKR": "KKR",
+    # 헬스케어
+    "LLY": "일라이릴리", "UNH": "유나이티드헬스", "JNJ": "존슨앤존슨",
+    "MRK": "머크", "ABBV": "애브비", "PFE": "화이자",
+    "TMO": "써모피셔", "ABT": "애보트", "AMGN": "암젠",
+    "GILD": "길리어드", "ISRG": "인튜이티브서지컬", "VRTX": "버텍스제약",
+    "REGN": "리제네론", "BMY": "브리스톨마이어스",
+    "MRNA": "모더나", "GEHC": "GE헬스케어",
+    # 산업재/방산
+    "GE": "GE에어로스페이스", "CAT": "캐터필러", "RTX": "RTX 레이시온",
+    "HON": "하니웰", "BA": "보잉", "LMT": "록히드마틴",
+    "DE": "디어앤컴퍼니", "UPS": "UPS", "FDX": "페덱스",
+    "NOC": "노스롭그루먼", "GD": "제너럴다이내믹스",
+    "UNP": "유니온퍼시픽", "UBER": "우버",
+    # 소비재/리테일
+    "WMT": "월마트", "COST": "코스트코", "HD": "홈디포",
+    "LOW": "로우스", "TJX": "TJX", "MCD": "맥도날드",
+    "NKE": "나이키", "SBUX": "스타벅스", "BKNG": "부킹홀딩스",
+    "MAR": "메리어트", "HLT": "힐튼", "ABNB": "에어비앤비",
+    "CMG": "치폴레", "DASH": "도어대시", "GM": "제너럴모터스",
+    "F": "포드", "RCL": "로열캐리비안", "LULU": "룰루레몬",
+    # 통신/미디어
+    "TMUS": "T모바일", "DIS": "디즈니", "CMCSA": "컴캐스트",
+    "VZ": "버라이즌", "T": "AT&T", "WBD": "워너브라더스",
+    "EA": "일렉트로닉아츠", "TTWO": "테이크투", "LYV": "라이브네이션",
+    # 소비필수
+    "KO": "코카콜라", "PEP": "펩시코", "PG": "P&G 프록터앤갬블",
+    "PM": "필립모리스", "CL": "콜게이트", "MDLZ": "몬델리즈",
+    "KHC": "크래프트하인즈",
+    # 에너지
+    "XOM": "엑손모빌", "CVX": "셰브론", "COP": "코노코필립스",
+    "SLB": "슐룸버거", "OXY": "옥시덴탈",
+    # 유틸리티/소재
+    "NEE": "넥스트에라에너지", "CEG": "컨스텔레이션에너지",
+    "LIN": "린데", "SHW": "셔윈윌리엄스", "NEM": "뉴몬트",
+    "FCX": "프리포트맥모란",
+    # 부동산
+    "PLD": "프롤로지스", "AMT": "아메리칸타워", "EQIX": "에퀴닉스",
+    # 기타 주목
+    "APP": "앱러빈", "CVNA": "카바나", "AXON": "액슨엔터프라이즈",
+    "TTD": "더트레이드데스크", "SMCI": "슈퍼마이크로",
+    "FSLR": "퍼스트솔라", "VST": "비스트라",
+}
@@ -0,0 +1,178 @@
+"""
+AI MESH — 뉴스 수집 스케줄러 (호출 예산 안에서 전 종목 순환)
+매 실행마다 네이버 호출 예산으로 검색할 종목을 고른다.
+전 종목을 매일 검색하지 않아도 모든 종목이 MAX_STALE_DAYS일 안에 한 번은 갱신된다.
+
+우선순위:
+  1. 마지막 검색 후 MAX_STALE_DAYS일 이상 지났거나 한 번도 검색하지 않은 종목 (오래된 순)
+  2. 나머지는 점수 순 — 경과 일수 × (1 + 뉴스 속도) × 시가총액 가중치
+     - 뉴스 속도: 검색마다 (새 기사 수 / 경과 일수)의 지수 이동 평균
+     - 시가총액 가중치: 1 + log(1 + 시총 / 중앙값)
+
+상태 파일(news_schedule.json):
+  {"NVDA": {"last": "2026-05-04T07:00:00+09:00", "velocity": 3.2}}
+
+설정 (환경변수):
+  - NEWS_CALL_BUDGET: 실행당 네이버 호출 예산 (기본 600, 일일 한도 잔량이 더 적으면 잔량)
+  - NEWS_MAX_STALE_DAYS: 종목별 최대 미검색 일수 (기본 3)
+
+검색어마다 페이지를 넘기므로(NEWS_MAX_PAGES) 종목당 호출 수는 검색어 수 × 페이지 수까지 늘 수 있다.
+예산은 그 최악의 값으로 나누고, 예산이 빠듯하면 순환이 유지되도록 페이지 수를 줄인다(plan_pages).
+"""
+
+import os
+import re
+import json
+import math
+from datetime import datetime
+
+from env_config import env_number
+from query_stats import max_pages
+from news_queries import NASDAQ100_QUERIES, SP500_QUERIES
+
+SCHEDULE_FILENAME = "news_schedule.json"
+DEFAULT_CALL_BUDGET = 600
+DEFAULT_MAX_STALE_DAYS = 3
+QUERIES_PER_TICKER = 2    # 종목명 검색 + "{ticker} 주가" 검색 (최대), 검색어마다 최대 pages회 호출
+VELOCITY_ALPHA = 0.3      # 뉴스 속도 이동 평균 반영 비율
+STALE_SLACK_DAYS = 0.5    # 실행 시각이 조금씩 밀려도 같은 날짜로 취급
+
+_NAME_SUFFIX_RE = re.compile(
+    r"(\s*\(.*?\)|,|\.|\s+(common stock|ordinary shares|(class|cl) [a-z]\b.*|non-vtg.*|"
+    r"new|del|incorporated|inc|corporation|corp|company|co|plc|ltd|limited|holdings|"
+    r"public limited company|&|and))+\s*$",
+    re.IGNORECASE,
+)
+
+
+def call_budget():
+    return env_number("NEWS_CALL_BUDGET", DEFAULT_CALL_BUDGET, int, minimum=1)
+
+
+def max_stale_days():
+    return env_number("NEWS_MAX_STALE_DAYS", DEFAULT_MAX_STALE_DAYS, int, minimum=1)
+
+
+def plan_pages(budget, ticker_count, max_stale=None):
+    """검색어당 최대 페이지 수 — 예산이 빠듯하면 순환(하루 필요 종목 수)을 지키도록 줄인다"""
+    max_stale = max_stale or max_stale_days()
+    needed = max(1, math.ceil(ticker_count / max_stale))
+    return max(1, min(max_pages(), budget // (QUERIES_PER_TICKER * needed)))
+
+
+def company_query(name, ticker):
+    """프로필 회사명 → 검색어 ("Amphenol Corporation" → "Amphenol"), 없으면 티커"""
+    name = re.sub(r"^the\s+", "", (name or "").strip(), flags=re.IGNORECASE)
+    name = _NAME_SUFFIX_RE.sub("", name).strip()
+    return name or ticker
+
+
+def load_profiles(data_dir):
+    """profiles.json → {ticker: profile} (없으면 빈 dict)"""
+    path = os.path.join(data_dir, "profiles.json")
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("data", {})
+    except Exception as e:
+        print(f"  ⚠️ profiles.json 로드 실패: {e}")
+        return {}
+
+
+def korean_queries(tickers, queries):
+    """전 종목 한글 검색어 — 주어진 표, 다른 유니버스의 표 순 (없으면 빠짐)"""
+    korean = {**NASDAQ100_QUERIES, **SP500_QUERIES, **queries}
+    return {t: korean[t] for t in tickers if t in korean}
+
+
+def universe_queries(tickers, queries, profiles):
+    """전 종목 검색어 — 한글 검색어(korean_queries), 없으면 프로필 회사명
+
+    영문 회사명("Seagate Technology")은 네이버 검색 결과가 거의 없으므로 마지막 수단.
+    """
+    korean = korean_queries(tickers, queries)
+    return {
+        t: korean.get(t) or company_query(profiles.get(t, {}).get("companyName"), t)
+        for t in tickers
+    }
+
+
+def matcher_queries(tickers, queries):
+    """언급 추출용 별칭 표 — 전 종목 티커 + 한글 검색어
+
+    영문 회사명 단어("New", "York", "Street", "Insurance" …)는 일반 단어와 겹치므로 넣지 않는다.
+    """
+    korean = korean_queries(tickers, queries)
+    return {t: korean.get(t, t) for t in tickers}
+
+
+class CoverageScheduler:
+    def __init__(self, path, state=None):
+        self.path = path
+        self.state = state or {}  # ticker → {"last": iso, "velocity": float}
+
+    @classmethod
+    def load(cls, path):
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return cls(path, json.load(f))
+            except Exception as e:
+                print(f"  ⚠️ {os.path.basename(path)} 로드 실패 (처음부터): {e}")
+        return cls(path)
+
+    def stale_days(self, ticker, now):
+        """마지막 검색 후 경과 일수 (검색한 적 없으면 None)"""
+        last = self.state.get(ticker, {}).get("last")
+        if not last:
+            return None
+        try:
+            return max(0.0, (now - datetime.fromisoformat(last)).total_seconds() / 86400)
+        except ValueError:
+            return None
+
+    def plan(self, tickers, now, budget, market_caps=None, max_stale=None, pages=1):
+        """이번 실행에 검색할 종목 목록 (우선순위 순) — 종목당 최악의 호출 수(검색어 × pages)로 예산을 나눈다"""
+        max_stale = max_stale or max_stale_days()
+        slots = max(0, budget // (QUERIES_PER_TICKER * pages))
+        caps = sorted(c for c in (market_caps or {}).values() if c)
+        median = caps[len(caps) // 2] if caps else 0
+
+        overdue, ranked = [], []
+        for t in tickers:
+            stale = self.stale_days(t, now)
+            cap = (market_caps or {}).get(t) or 0
+            weight = 1 + math.log1p(cap / median) if median else 1.0
+            if stale is None or stale >= max_stale - STALE_SLACK_DAYS:
+                # 오래된 순, 같으면(첫 실행) 시가총액 큰 순
+                overdue.append((-(stale if stale is not None else math.inf), -weight, t))
+                continue
+            velocity = self.state[t].get("velocity", 0.0)
+            ranked.append((-(stale * (1 + velocity) * weight), t))
+
+        chosen = [t for *_, t in sorted(overdue)][:slots]
+        chosen += [t for _, t in sorted(ranked)][:slots - len(chosen)]
+
+        needed = math.ceil(len(tickers) / max_stale)
+        if slots < needed:
+            print(f"  ⚠️ 호출 예산 {budget}회로는 {max_stale}일 순환 불가 "
+                  f"(하루 {needed * QUERIES_PER_TICKER * pages}회 필요)")
+        return chosen
+
+    def record(self, ticker, now, new_count):
+        """검색 결과 반영 — 뉴스 속도 갱신 + 마지막 검색 시각"""
+        entry = self.state.setdefault(ticker, {})
+        stale = self.stale_days(ticker, now)
+        if stale is not None:
+            rate = new_count / max(stale, 1.0)
+            prev = entry.get("velocity", rate)
+            entry["velocity"] = round(prev + VELOCITY_ALPHA * (rate - prev), 3)
+        else:
+            entry["velocity"] = float(new_count)
+        entry["last"] = now.isoformat()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(self.state.items())), f, ensure_ascii=False, indent=1)
@@ -0,0 +1,183 @@
+"""
+AI MESH — 정규화된 뉴스 저장소
+같은 기사가 여러 종목 검색에 걸려도 본문(제목 · 요약 · URL · 날짜 · 언급)은 한 번만 저장하고,
+종목별 목록에는 기사 id만 둔다.
+
+news_store.json.gz (정규화, 수집기의 원본 — minified JSON을 gzip으로만 저장):
+  {
+    "format": 2,
+    "articles": {"<id>": {"title", "desc", "url", "date", "ts", "mentions"}},
+    "stocks": {"NVDA": ["<id>", ...]},   ← ts 내림차순 (최신 기사 먼저)
+    "validated": {"NVDA": "<규칙 버전>"},   ← 종목 목록별 비경제/중복 검증 버전
+    ...메타(updated, stats, co_mention_edges)
+  }
+
+ts: 수집 시 한 번 계산한 epoch 초 (date 문자열은 표시용으로 그대로 둔다).
+종목별 목록이 ts 순으로 정렬돼 있어 보관 기간 정리는 이분 탐색 후 잘라내기(prune_before),
+"X 이후 기사"는 앞부분 슬라이스(ids_since)로 끝난다.
+ts가 없는 예전 기사는 로드할 때 date(ISO 8601 · RFC 822)를 한 번 파싱해 채운다.
+
+news.json (호환용, 기존 형식): stocks[ticker]가 기사 객체 목록 — export_legacy()로 만든다.
+화면(HTML)이 읽는 파일이라 이것만 들여쓰기 JSON으로 두고 min/gz 사본은 만들지 않는다.
+news_store.json.gz가 아직 없으면 기존 news.json을 읽어 변환한다.
+"""
+
+import os
+import gzip
+import json
+import time
+import bisect
+import hashlib
+from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
+
+from news_dedupe import canonical_url, title_key
+
+STORE_FORMAT = 2
+STORE_FILENAME = "news_store.json.gz"
+LEGACY_FILENAME = "news.json"
+
+KST = timezone(timedelta(hours=9))
+
+
+def parse_timestamp(date):
+    """기사 날짜 문자열(ISO 8601 또는 RFC 822) → epoch 초 (알 수 없으면 None, 시간대 없으면 KST)"""
+    if not date:
+        return None
+    try:
+        dt = datetime.fromisoformat(date)
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(date)
+        except (TypeError, ValueError):
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=KST)
+    return int(dt.timestamp())
+
+
+def _newest_first(article):
+    return -article.get("ts", 0)
+
+
+def sort_by_time(articles):
+    """기사 목록을 ts 내림차순으로 (이미 거의 정렬돼 있으면 선형 시간)"""
+    articles.sort(key=_newest_first)
+    return articles
+
+
+def insert_by_time(articles, article):
+    """ts 내림차순 목록에 기사 하나 삽입"""
+    bisect.insort(articles, article, key=_newest_first)
+
+
+def prune_before(articles, cutoff_ts):
+    """ts 내림차순 목록에서 cutoff_ts보다 오래된 기사를 잘라냄 → 잘린 개수"""
+    keep = bisect.bisect_right(articles, -cutoff_ts, key=_newest_first)
+    removed = len(articles) - keep
+    del articles[keep:]
+    return removed
+
+
+def article_id(article):
+    """정규화 URL(없으면 제목 키)의 해시 — 같은 기사는 어느 종목에서 오든 같은 id"""
+    basis = canonical_url(article.get("url", "")) or title_key(article.get("title", "")) \
+        or article.get("title", "")
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()[:12]
+
+
+class NewsStore:
+    def __init__(self, articles=None, stocks=None, meta=None):
+        self.articles = articles or {}  # id → article
+        self.stocks = stocks or {}      # ticker → [id, ...]
+        self.meta = meta or {}
+
+    @classmethod
+    def load(cls, data_dir):
+        """news_store.json.gz → 저장소 (없으면 기존 news.json에서 변환)"""
+        store_path = os.path.join(data_dir, STORE_FILENAME)
+        legacy_path = os.path.join(data_dir, LEGACY_FILENAME)
+        for path, normalized in ((store_path, True), (legacy_path, False)):
+            if not os.path.exists(path):
+                continue
+            try:
+                opener = gzip.open if normalized else open
+                with opener(path, "rt", encoding="utf-8") as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"  ⚠️ {os.path.basename(path)} 로드 실패: {e}")
+                continue
+            meta = {k: v for k, v in data.items() if k not in ("articles", "stocks")}
+            if normalized and data.get("format") == STORE_FORMAT:
+                store = cls(data.get("articles", {}), data.get("stocks", {}), meta)
+            else:
+                store = cls.from_stocks(data.get("stocks", {}), meta)
+            print(f"  📄 기존 {os.path.basename(path)} 로드: 기사 {len(store.articles)}개 "
+                  f"(종목별 참조 {store.reference_count()}개)")
+            migrated, unknown = store.migrate_timestamps()
+            if migrated:
+                note = f" (날짜 불명 {unknown}개는 지금 시각으로)" if unknown else ""
+                print(f"  🕒 날짜 → ts 변환: {migrated}개{note}")
+            return store
+        print("  📄 기존 뉴스 데이터 없음 — 새로 생성")
+        return cls()
+
+    @classmethod
+    def from_stocks(cls, stocks, meta=None):
+        """{ticker: [article, ...]} → 정규화 (같은 id는 처음 나온 기사 하나만 보관)"""
+        store = cls(meta=meta)
+        for ticker, articles in stocks.items():
+            ids = []
+            seen = set()
+            for art in articles:
+                aid = article_id(art)
+                if aid in seen:
+                    continue
+                seen.add(aid)
+                store.articles.setdefault(aid, art)
+                ids.append(aid)
+            store.stocks[ticker] = ids
+        return store
+
+    def migrate_timestamps(self, default_ts=None):
+        """ts가 없는 기사에 date를 파싱해 채우고 종목별 목록을 ts 순으로 정렬 → (채운 수, 날짜 불명 수)
+
+        날짜를 알 수 없는 기사는 default_ts(기본: 지금)로 — 영원히 남지 않고 보관 기간 뒤 정리된다.
+        """
+        default_ts = int(time.time()) if default_ts is None else default_ts
+        migrated = unknown = 0
+        for art in self.articles.values():
+            if "ts" in art:
+                continue
+            ts = parse_timestamp(art.get("date"))
+            if ts is None:
+                ts = default_ts
+                unknown += 1
+            art["ts"] = ts
+            migrated += 1
+        for ids in self.stocks.values():
+            ids.sort(key=lambda aid: -self.articles.get(aid, {}).get("ts", 0))
+        return migrated, unknown
+
+    def ids_since(self, ticker, ts):
+        """ticker 기사 중 ts 이후(포함) 것의 id — 정렬된 목록의 앞부분"""
+        ids = self.stocks.get(ticker, [])
+        end = bisect.bisect_right(ids, -ts, key=lambda aid: -self.articles[aid].get("ts", 0))
+        return ids[:end]
+
+    def expand(self):
+        """{ticker: [article, ...]} — 기사 객체는 복사하지 않고 공유"""
+        return {
+            ticker: [self.articles[aid] for aid in ids if aid in self.articles]
+            for ticker, ids in self.stocks.items()
+        }
+
+    def reference_count(self):
+        return sum(len(ids) for ids in self.stocks.values())
+
+    def to_dict(self, meta):
+        return {**meta, "format": STORE_FORMAT, "articles": self.articles, "stocks": self.stocks}
+
+    def export_legacy(self, meta):
+        """기존 news.json 형식 (종목별 기사 객체 목록)"""
+        return {**meta, "stocks": self.expand()}
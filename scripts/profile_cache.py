@@ -0,0 +1,179 @@
+"""
+AI MESH — 기업 프로필 캐시 (TTL)
+/v3/reference/tickers/{ticker} 결과를 티커별로 저장해 두고,
+필드 그룹별 TTL이 지난 프로필만 다시 받아오도록 한다.
+
+설정 (환경변수):
+  - PROFILE_TTL_DAYS: 모든 그룹의 TTL(일)을 한 번에 지정
+  - PROFILE_TTL_<GROUP>: 그룹별 TTL(일) — 예) PROFILE_TTL_METRICS=3
+  - PROFILE_REFRESH: "1"/"all" 이면 전체 강제 갱신, "NVDA,AAPL" 이면 해당 티커만
+
+캐시 파일이 없으면 기존 profiles.json(유니버스별)으로 초기화(seed)한다.
+seed 시각은 티커마다 TTL 구간 안에 고르게 흩어 둔다 — 같은 시각이면 TTL이 지나는 날
+전 종목을 한 번에 다시 받게 된다 (basic 요금제로 ~100분).
+
+TTL이 지난 그룹만 갱신한다: 호출 한 번에 모든 필드가 오더라도 put()에 넘긴 그룹의
+필드와 갱신 시각만 바꾸므로, 그룹별 TTL이 가장 짧은 TTL로 합쳐지지 않는다.
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime, timezone, timedelta
+
+from env_config import env_number
+
+# 필드 그룹 → (필드 목록, 기본 TTL 일수)
+FIELD_GROUPS = {
+    "identity": (["companyName", "description", "industry", "sector", "ceo",
+                  "country", "exchange", "website", "ipoDate"], 30),
+    "branding": (["image"], 30),
+    "metrics": (["fullTimeEmployees", "mktCap"], 7),
+}
+
+CACHE_FILENAME = "profile_cache.json"
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def _parse_time(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    # profiles.json의 "2026-03-03 03:06 KST" 형식
+    try:
+        dt = datetime.strptime(value.replace(" KST", ""), "%Y-%m-%d %H:%M")
+        return dt.replace(tzinfo=timezone(timedelta(hours=9)))
+    except ValueError:
+        return None
+
+
+def group_ttls():
+    """환경변수를 반영한 그룹별 TTL (timedelta)"""
+    ttls = {}
+    for group, (_, days) in FIELD_GROUPS.items():
+        days = env_number("PROFILE_TTL_DAYS", days, minimum=0.0)
+        ttls[group] = timedelta(days=env_number(f"PROFILE_TTL_{group.upper()}", days, minimum=0.0))
+    return ttls
+
+
+def _spread(ticker):
+    """티커 → [0, 1) 사이 고정 값 (seed 시각 분산용)"""
+    return int(hashlib.sha1(ticker.encode("utf-8")).hexdigest()[:8], 16) / 2 ** 32
+
+
+def forced_refresh():
+    """PROFILE_REFRESH → True(전체) / set(티커) / None"""
+    value = os.environ.get("PROFILE_REFRESH", "").strip()
+    if not value or value.lower() in ("0", "false", "no"):
+        return None
+    if value.lower() in ("1", "true", "yes", "all"):
+        return True
+    return {t.strip().upper() for t in value.split(",") if t.strip()}
+
+
+class ProfileCache:
+    def __init__(self, path, entries=None):
+        self.path = path
+        self.entries = entries or {}  # ticker → {"fetched": {group: iso}, "data": {...}}
+
+    @classmethod
+    def load(cls, path, seed_paths=()):
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return cls(path, json.load(f).get("entries", {}))
+            except Exception as e:
+                print(f"  ⚠️ 프로필 캐시 로드 실패: {e}")
+
+        cache = cls(path)
+        for seed_path in seed_paths:
+            if os.path.exists(seed_path):
+                cache.seed_from_profiles(seed_path)
+        return cache
+
+    def seed_from_profiles(self, profiles_path):
+        """기존 profiles.json → 캐시 초기값
+
+        갱신 시각은 지금에서 티커별로 TTL × [0, 1)만큼 앞당긴 값 — 만료가 앞으로의 TTL 구간에
+        고르게 퍼진다. (파일의 updated_kst를 쓰면 오래된 파일일 때 전부 이미 만료된 상태가 된다)
+        """
+        try:
+            with open(profiles_path, "r", encoding="utf-8") as f:
+                old = json.load(f)
+        except Exception as e:
+            print(f"  ⚠️ profiles.json seed 실패: {e}")
+            return
+        now = _now()
+        ttls = group_ttls()
+        fields = [k for group_fields, _ in FIELD_GROUPS.values() for k in group_fields]
+        count = 0
+        for sym, d in old.get("data", {}).items():
+            if not d.get("companyName"):
+                continue
+            data = {"symbol": sym, **{k: d[k] for k in fields if k in d}}
+            self.entries[sym] = {
+                "fetched": {g: (now - ttls[g] * _spread(sym)).isoformat() for g in FIELD_GROUPS},
+                "data": data,
+            }
+            count += 1
+        print(f"  📦 profiles.json에서 프로필 캐시 seed: {count}개")
+
+    def get(self, ticker):
+        entry = self.entries.get(ticker)
+        return dict(entry["data"]) if entry else None
+
+    def put(self, ticker, profile, groups=None):
+        """groups(기본: 전체)의 필드와 갱신 시각만 반영 — 나머지 그룹은 캐시 값 유지"""
+        groups = list(FIELD_GROUPS) if groups is None else groups
+        entry = self.entries.setdefault(ticker, {"fetched": {}, "data": {}})
+        grouped = {k for group_fields, _ in FIELD_GROUPS.values() for k in group_fields}
+        data = {k: v for k, v in entry["data"].items() if k in grouped}
+        data.update({k: v for k, v in profile.items() if k not in grouped})
+        for group in groups:
+            for k in FIELD_GROUPS[group][0]:
+                if k in profile:
+                    data[k] = profile[k]
+                else:
+                    data.pop(k, None)
+        entry["data"] = data
+        stamp = _now().isoformat()
+        entry["fetched"].update({g: stamp for g in groups})
+
+    def stale_groups(self, ticker, ttls, now=None):
+        """TTL이 지난 그룹 목록 (캐시에 없으면 전체)"""
+        entry = self.entries.get(ticker)
+        if not entry:
+            return list(FIELD_GROUPS)
+        now = now or _now()
+        stale = []
+        for group, ttl in ttls.items():
+            fetched = _parse_time(entry.get("fetched", {}).get(group))
+            if fetched is None or now - fetched >= ttl:
+                stale.append(group)
+        return stale
+
+    def due_groups(self, tickers, refresh=None):
+        """다시 받아야 할 티커 → 갱신할 그룹 목록 (입력 순서 유지)"""
+        ttls = group_ttls()
+        now = _now()
+        due = {}
+        for t in tickers:
+            if refresh is True or (refresh and t in refresh):
+                due[t] = list(FIELD_GROUPS)
+                continue
+            groups = self.stale_groups(t, ttls, now)
+            if groups:
+                due[t] = groups
+        return due
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"updated": _now().isoformat(), "entries": self.entries},
+                      f, ensure_ascii=False, indent=1)
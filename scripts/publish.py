@@ -0,0 +1,142 @@
+"""
+AI MESH — 공개 JSON 출력 (minified + 사전 압축 + manifest)
+GitHub Pages로 네트워크 맵 방문자에게 그대로 전송되는 파일들을 작게 만든다.
+
+name.json 하나를 저장할 때 함께 만드는 파일:
+  - name.json         기존 경로 (PRETTY_JSON=1 이면 들여쓰기, 0 이면 minified)
+  - name.min.json     공백 없는 minified JSON
+  - name.min.json.gz  gzip (mtime 고정 → 내용이 같으면 바이트도 같아 불필요한 커밋 없음)
+  - name.min.json.br  brotli (brotli 패키지가 설치된 경우에만)
+  - manifest.json     같은 폴더의 파일별 크기 · sha256 · 갱신 시각
+
+variants=False면 name.json 하나만 쓴다 (사본을 읽는 곳이 없는 파일 — 예: 뉴스 호환본 news.json).
+publish_gzip()은 반대로 name.json.gz 하나만 쓴다 (사람이 읽을 일 없는 원본 — 예: news_store.json.gz).
+
+manifest는 만드는 작업(워크플로)마다 따로 둔다 — 시장 데이터는 manifest.json,
+뉴스는 news_manifest.json. 같은 cron에서 도는 작업들이 한 파일을 서로 덮어쓰면
+나중에 끝난 쪽의 push가 거부되거나 rebase 충돌이 나기 때문.
+
+설정 (환경변수):
+  - PRETTY_JSON: name.json 들여쓰기 여부 (기본 1)
+"""
+
+import os
+import gzip
+import json
+import hashlib
+from datetime import datetime, timezone
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST_FILENAME = "manifest.json"
+NEWS_MANIFEST_FILENAME = "news_manifest.json"
+PRETTY_INDENT = 1
+
+
+def pretty_enabled():
+    value = os.environ.get("PRETTY_JSON", "1").strip().lower()
+    return value not in ("0", "false", "no")
+
+
+def _sha256(payload):
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _write_bytes(path, payload):
+    """내용이 같으면 다시 쓰지 않음"""
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if f.read() == payload:
+                return
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def _min_name(filename):
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.min{ext}"
+
+
+def update_manifest(data_dir, filename, entry, manifest_name=MANIFEST_FILENAME):
+    path = os.path.join(data_dir, manifest_name)
+    manifest = {"files": {}}
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except Exception as e:
+            print(f"  ⚠️ manifest 로드 실패 (새로 작성): {e}")
+    files = manifest.setdefault("files", {})
+    previous = files.get(filename)
+    if previous and previous.get("sha256") == entry["sha256"] and previous.get("bytes") == entry["bytes"]:
+        return  # 내용이 그대로면 manifest도 그대로 (불필요한 커밋 방지)
+    files[filename] = entry
+    manifest["updated"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    payload = json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True).encode("utf-8")
+    _write_bytes(path, payload)
+
+
+def publish_json(data, data_dir, filename, indent=PRETTY_INDENT, manifest_name=MANIFEST_FILENAME,
+                 variants=True):
+    """data → name.json / name.min.json / .gz / (.br) + manifest — manifest 항목 반환"""
+    os.makedirs(data_dir, exist_ok=True)
+
+    minified = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if pretty_enabled():
+        main_payload = json.dumps(data, ensure_ascii=False, indent=indent).encode("utf-8")
+    else:
+        main_payload = minified
+    _write_bytes(os.path.join(data_dir, filename), main_payload)
+
+    entry = {
+        "sha256": _sha256(minified),
+        "bytes": len(main_payload),
+        "updated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    if not variants:
+        update_manifest(data_dir, filename, entry, manifest_name)
+        return entry
+
+    min_name = _min_name(filename)
+    gz_payload = gzip.compress(minified, compresslevel=9, mtime=0)
+    _write_bytes(os.path.join(data_dir, min_name), minified)
+    _write_bytes(os.path.join(data_dir, min_name + ".gz"), gz_payload)
+    entry["min"] = {"path": min_name, "bytes": len(minified)}
+    entry["gzip"] = {"path": min_name + ".gz", "bytes": len(gz_payload)}
+    if brotli is not None:
+        br_payload = brotli.compress(minified, quality=11)
+        _write_bytes(os.path.join(data_dir, min_name + ".br"), br_payload)
+        entry["br"] = {"path": min_name + ".br", "bytes": len(br_payload)}
+
+    update_manifest(data_dir, filename, entry, manifest_name)
+    return entry
+
+
+def publish_gzip(data, data_dir, filename, manifest_name=MANIFEST_FILENAME):
+    """data → filename(.json.gz) 하나만 (minified + gzip) + manifest — manifest 항목 반환"""
+    os.makedirs(data_dir, exist_ok=True)
+    minified = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    payload = gzip.compress(minified, compresslevel=9, mtime=0)
+    _write_bytes(os.path.join(data_dir, filename), payload)
+    entry = {
+        "sha256": _sha256(minified),
+        "bytes": len(payload),
+        "raw_bytes": len(minified),
+        "updated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    update_manifest(data_dir, filename, entry, manifest_name)
+    return entry
+
+
+def describe(entry):
+    """로그용 크기 요약"""
+    parts = [f"{label} {entry[key]['bytes'] / 1024:.1f} KB"
+             for key, label in (("min", "min"), ("gzip", "gzip"), ("br", "br")) if key in entry]
+    if "raw_bytes" in entry:
+        parts.append(f"압축 전 {entry['raw_bytes'] / 1024:.1f} KB")
+    return ", ".join(parts) or "사본 없음"
@@ -0,0 +1,215 @@
+"""
+AI MESH — 네이버 검색어별 수익률(yield) 통계
+검색어마다 실행을 넘어 누적한다: 호출 수, 받은 기사 수, 허용 언론사 + 경제 필터 통과 수, 새 기사 수.
+
+이 통계로
+  - display 크기 조절: 새 기사 비율이 낮은 검색어는 한 번에 더 많이, 높은 검색어는 필요한 만큼만
+  - 죽은 검색어 건너뛰기: 새 결과가 있었는데도 DEAD_AFTER번 연속으로 통과 기사가 0건이면 건너뜀
+    (PROBE_DAYS일마다 한 번은 다시 시도해 되살아났는지 확인)
+  - 대체 별칭 시험: 종목의 기본 검색어가 모두 죽었으면 별칭(검색어 단어 · 티커)을 하나씩 시도
+  - 증분 수집 워터마크: 검색어별로 지난 실행에서 본 가장 최신 기사(pubDate · URL)를 기억하고,
+    start로 페이지를 넘기다 그 지점을 지나면 멈춘다 (Crawl) — 이미 본 결과를 다시 읽지 않고,
+    실행 사이에 display보다 많이 쌓인 기사도 놓치지 않는다
+
+수치는 호출마다 DECAY를 곱해 최근 결과에 더 큰 비중을 둔다.
+
+상태 파일(query_stats.json):
+  {"엔비디아": {"calls": 4.1, "items": 80.2, "passed": 31.0, "new": 12.5, "streak": 0, "last": "...",
+             "mark": {"date": "2026-05-04T06:58:00+09:00", "url": "https://..."}}}
+
+설정 (환경변수):
+  - NEWS_MAX_PAGES: 검색어당 최대 페이지 수 (기본 3)
+"""
+
+import os
+import json
+import math
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from env_config import env_number
+from ticker_matcher import MIN_TICKER_LEN
+
+STATS_FILENAME = "query_stats.json"
+DECAY = 0.8          # 호출마다 이전 누적치에 곱하는 값
+MIN_SAMPLES = 2      # 이보다 적게 호출된 검색어는 기본 display 사용
+MIN_DISPLAY = 10
+MAX_DISPLAY = 100    # 네이버 검색 API 최대값
+DEAD_AFTER = 5       # 연속 0건 호출 수
+PROBE_DAYS = 7       # 죽은 검색어 재시도 간격
+DEFAULT_MAX_PAGES = 3
+MAX_START = 1000     # 네이버 검색 API start 최대값
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def max_pages():
+    return env_number("NEWS_MAX_PAGES", DEFAULT_MAX_PAGES, int, minimum=1)
+
+
+def _pub_time(item):
+    try:
+        return parsedate_to_datetime(item.get("pubDate", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+def _item_url(item):
+    return item.get("originallink") or item.get("link", "")
+
+
+class Crawl:
+    """검색어 하나의 증분 수집 — for item in crawl: 워터마크보다 새 항목만 최신순으로
+
+    fetch(start)는 네이버 응답(dict) 또는 실패 시 None.
+    워터마크가 없으면(첫 실행) 첫 페이지만, 있으면 워터마크를 지날 때까지 다음 페이지를 받는다
+    (호출 측은 끝까지 읽는다 — 종목별 목표 수를 채웠다고 멈추면 그 뒤 기사는 다음 실행에 다시 안 보인다).
+    워터마크에 닿았거나 결과가 끝났으면 complete, 페이지 한도에 걸렸으면 truncated —
+    둘 다 워터마크를 옮긴다. 중간 페이지 호출이 실패했을 때만 이전 워터마크를 유지한다.
+    """
+
+    def __init__(self, fetch, display, mark, pages=None):
+        self.fetch = fetch
+        self.display = display
+        self.mark = mark
+        self.max_pages = pages or max_pages()
+        self.pages = 0
+        self.newest = None   # 첫 페이지의 첫 항목 (다음 워터마크)
+        self.failed = False  # 첫 페이지부터 실패
+        self.complete = False  # 워터마크까지(또는 결과 끝까지) 다 읽음
+        self.truncated = False  # 페이지 한도에서 멈춤 (그 너머는 예산 밖으로 보고 버림)
+
+    def is_known(self, item):
+        """워터마크 지점이거나 그보다 오래된 항목"""
+        if not self.mark:
+            return False
+        if _item_url(item) == self.mark.get("url"):
+            return True
+        t = _pub_time(item)
+        try:
+            return t is not None and t < datetime.fromisoformat(self.mark["date"])
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    def __iter__(self):
+        start = 1
+        while self.pages < self.max_pages and start <= MAX_START:
+            result = self.fetch(start)
+            if result is None:
+                self.failed = self.pages == 0
+                return
+            self.pages += 1
+            items = result.get("items", [])
+            if self.newest is None and items:
+                self.newest = items[0]
+            for item in items:
+                if self.is_known(item):
+                    self.complete = True
+                    return
+                yield item
+            if len(items) < self.display:
+                self.complete = True
+                return
+            if not self.mark:
+                return
+            start += self.display
+        self.truncated = True
+
+
+def alternate_queries(ticker, query):
+    """기본 검색어가 죽었을 때 시도할 별칭 — 검색어의 단어들, 그리고 티커"""
+    words = [w for w in query.split() if len(w) >= 2 and w != query]
+    if len(ticker) >= MIN_TICKER_LEN and ticker != query:
+        words.append(ticker)
+    return list(dict.fromkeys(words))
+
+
+class QueryStats:
+    def __init__(self, path, state=None):
+        self.path = path
+        self.state = state or {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path):
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return cls(path, json.load(f))
+            except Exception as e:
+                print(f"  ⚠️ {os.path.basename(path)} 로드 실패 (처음부터): {e}")
+        return cls(path)
+
+    def is_dead(self, query, now=None):
+        """연속 DEAD_AFTER번 통과 기사 0건 — 단, PROBE_DAYS일이 지났으면 재시도 허용"""
+        entry = self.state.get(query)
+        if not entry or entry.get("streak", 0) < DEAD_AFTER:
+            return False
+        try:
+            last = datetime.fromisoformat(entry["last"])
+        except (KeyError, ValueError):
+            return False
+        return ((now or _now()) - last).days < PROBE_DAYS
+
+    def plan(self, ticker, query):
+        """이번에 쓸 검색어 순서 — 죽은 검색어는 빼고, 전부 죽었으면 대체 별칭 하나"""
+        now = _now()
+        base = [query, f"{ticker} 주가"]
+        live = [q for q in base if not self.is_dead(q, now)]
+        if live:
+            return live
+        for alt in alternate_queries(ticker, query):
+            if not self.is_dead(alt, now):
+                return [alt]
+        return []
+
+    def display_for(self, query, want, default):
+        """새 기사 want개를 얻는 데 필요한 display 추정 (표본이 적으면 default)"""
+        entry = self.state.get(query)
+        if not entry or entry.get("calls", 0) < MIN_SAMPLES or not entry.get("new"):
+            return default
+        per_item = entry["new"] / max(entry["items"], 1e-9)
+        return max(MIN_DISPLAY, min(MAX_DISPLAY, math.ceil(want / per_item)))
+
+    def crawl(self, query, fetch, display, pages=None):
+        """워터마크 이후만 읽는 Crawl (pages: 최대 페이지 수, 기본 NEWS_MAX_PAGES)"""
+        with self.lock:
+            mark = self.state.get(query, {}).get("mark")
+        return Crawl(fetch, display, mark, pages)
+
+    def record(self, query, crawl, items, passed, new):
+        """검색어 하나의 수집 결과 반영 + 워터마크 전진 (스레드 안전)
+
+        워터마크는 이전 워터마크까지 다 읽었거나 페이지 한도에 걸렸을 때(또는 첫 실행) 옮긴다 —
+        중간 페이지 호출이 실패했으면 이전 워터마크를 그대로 둬서 다음 실행이 그 사이를 다시 훑는다
+        (이미 받은 기사는 중복 인덱스가 거른다).
+        """
+        if crawl.failed:
+            return
+        with self.lock:
+            entry = self.state.setdefault(query, {})
+            for key, value in (("calls", crawl.pages), ("items", items),
+                               ("passed", passed), ("new", new)):
+                entry[key] = round(entry.get(key, 0) * DECAY + value, 3)
+            if passed:
+                entry["streak"] = 0
+            elif items:  # 새 결과는 있었지만 쓸 만한 게 없음 (워터마크 이후 결과 없음은 제외)
+                entry["streak"] = entry.get("streak", 0) + 1
+            entry["last"] = _now().isoformat()
+            newest = crawl.newest and _pub_time(crawl.newest)
+            if newest and (crawl.complete or crawl.truncated or not crawl.mark) and not crawl.is_known(crawl.newest):
+                entry["mark"] = {"date": newest.isoformat(), "url": _item_url(crawl.newest)}
+
+    def summary(self):
+        """(죽은 검색어 수, 전체 검색어 수)"""
+        now = _now()
+        return sum(1 for q in self.state if self.is_dead(q, now)), len(self.state)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self.lock:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(dict(sorted(self.state.items())), f, ensure_ascii=False, indent=1)
@@ -0,0 +1,240 @@
+"""
+AI MESH — 토큰 버킷 레이트 리미터
+Massive API · MyMemory 번역 · 네이버 검색 호출이 공유하는 호출 속도 제어기
+
+설정 (환경변수):
+  - MASSIVE_TIER: 요금제 이름 (basic / starter / developer / advanced, 기본 basic)
+  - MASSIVE_CALLS_PER_MINUTE: 분당 호출 한도 직접 지정 (요금제보다 우선)
+  - MASSIVE_BURST: 연속 호출 허용 개수 (기본 1 — 무료 요금제의 슬라이딩 윈도우 대응)
+  - MYMEMORY_CALLS_PER_MINUTE / MYMEMORY_BURST: 번역 API 호출 속도 (기본 120/분, burst 2)
+  - NAVER_CALLS_PER_SECOND / NAVER_BURST: 네이버 검색 호출 속도 (기본 10/초, burst 5)
+  - NAVER_DAILY_QUOTA: 네이버 검색 일일 호출 한도 (기본 25000, KST 자정 초기화)
+
+고정 sleep 대신 필요한 만큼만 대기하고, 429 / Retry-After 응답이 오면
+같은 키를 쓰는 모든 호출을 그 시각까지 멈춘다.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
+
+from env_config import env_number
+
+# 요금제별 분당 호출 한도 (None = 한도 없음)
+TIER_CALLS_PER_MINUTE = {
+    "basic": 5,
+    "free": 5,
+    "starter": None,
+    "developer": None,
+    "advanced": None,
+}
+
+DEFAULT_TIER = "basic"
+
+
+class TokenBucket:
+    """분당 calls_per_minute 개의 토큰이 채워지는 버킷 (None이면 무제한)"""
+
+    def __init__(self, calls_per_minute, burst=1):
+        self.calls_per_minute = calls_per_minute
+        self.capacity = max(1, int(burst))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        if self.calls_per_minute:
+            rate = self.calls_per_minute / 60.0
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+
+    def acquire(self):
+        """토큰 1개를 얻을 때까지 대기. 실제로 기다린 시간(초)을 반환"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif not self.calls_per_minute:
+                    return waited
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    wait = (1 - self.tokens) * 60.0 / self.calls_per_minute
+            time.sleep(wait)
+            waited += wait
+
+    def block_for(self, seconds):
+        """429 / Retry-After — seconds 동안 모든 호출 중지, 버킷 비움"""
+        with self.lock:
+            now = time.monotonic()
+            self.blocked_until = max(self.blocked_until, now + max(0.0, seconds))
+            self._refill(now)
+            self.tokens = 0.0
+
+
+def parse_retry_after(value, default=60.0):
+    """Retry-After 헤더(초 또는 HTTP-date) → 대기 초"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except Exception:
+        return default
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def massive_limiter(api_key):
+    """API 키별로 하나씩 공유되는 Massive 리미터"""
+    with _limiters_lock:
+        if api_key in _limiters:
+            return _limiters[api_key]
+
+        tier = (os.environ.get("MASSIVE_TIER", "") or DEFAULT_TIER).strip().lower()
+        if tier not in TIER_CALLS_PER_MINUTE:
+            print(f"  ⚠️ 알 수 없는 MASSIVE_TIER '{tier}' → {DEFAULT_TIER}")
+            tier = DEFAULT_TIER
+        calls_per_minute = TIER_CALLS_PER_MINUTE[tier]
+        override = env_number("MASSIVE_CALLS_PER_MINUTE", None)
+        if override is not None:
+            calls_per_minute = override if override > 0 else None
+        burst = env_number("MASSIVE_BURST", 1, minimum=1)
+
+        limit = f"{calls_per_minute:g}/분" if calls_per_minute else "무제한"
+        print(f"  ⏱️ Massive 레이트 리밋: {tier} ({limit}, burst {int(burst)})")
+        limiter = TokenBucket(calls_per_minute, burst)
+        _limiters[api_key] = limiter
+        return limiter
+
+
+MYMEMORY_CALLS_PER_MINUTE = 120
+
+
+def mymemory_limiter():
+    """MyMemory 번역 호출이 공유하는 리미터 (MYMEMORY_CALLS_PER_MINUTE, 0 이하 = 무제한)"""
+    with _limiters_lock:
+        if "mymemory" in _limiters:
+            return _limiters["mymemory"]
+        calls_per_minute = env_number("MYMEMORY_CALLS_PER_MINUTE", MYMEMORY_CALLS_PER_MINUTE)
+        limiter = TokenBucket(calls_per_minute if calls_per_minute > 0 else None,
+                              env_number("MYMEMORY_BURST", 2, minimum=1))
+        _limiters["mymemory"] = limiter
+        return limiter
+
+
+NAVER_CALLS_PER_SECOND = 10
+NAVER_BURST = 5
+NAVER_DAILY_QUOTA = 25000
+NAVER_QUOTA_FILENAME = "naver_quota.json"
+
+KST = timezone(timedelta(hours=9))
+
+
+class QuotaExhausted(Exception):
+    """일일 호출 한도를 다 써서 더 호출하면 안 되는 경우"""
+
+
+class DailyQuota:
+    """파일에 저장되는 일일 호출 카운터 (같은 키를 쓰는 여러 작업이 공유)
+
+    파일 형식: {"day": "2026-05-04", "used": {"<키 해시>": 1234}}
+    날짜(KST)가 바뀌면 0부터 다시 센다. 키 원문은 저장하지 않는다.
+    이번 실행의 호출 수는 taken으로 따로 센다 (실행 중 날짜가 바뀌어도 줄지 않음).
+    """
+
+    def __init__(self, path, key, limit):
+        self.path = path
+        self.key = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+        self.limit = limit
+        self.lock = threading.Lock()
+        self.day = datetime.now(KST).strftime("%Y-%m-%d")
+        self.counts = {}
+        self.exhausted = False
+        self.taken = 0  # 이번 실행에서 차감한 호출 수
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("day") == self.day:
+                    self.counts = data.get("used", {})
+            except Exception as e:
+                print(f"  ⚠️ {os.path.basename(path)} 로드 실패 (0부터 계산): {e}")
+
+    @property
+    def used(self):
+        return self.counts.get(self.key, 0)
+
+    @property
+    def remaining(self):
+        return max(0, self.limit - self.used)
+
+    def take(self):
+        """호출 1회 차감 — 한도를 넘으면 QuotaExhausted"""
+        with self.lock:
+            today = datetime.now(KST).strftime("%Y-%m-%d")
+            if today != self.day:
+                self.day, self.counts, self.exhausted = today, {}, False
+            if self.used >= self.limit:
+                if not self.exhausted:
+                    print(f"  ⛔ 일일 호출 한도 {self.limit}회 소진 — 남은 호출 건너뜀")
+                self.exhausted = True
+                raise QuotaExhausted(f"daily quota {self.limit} reached")
+            self.counts[self.key] = self.used + 1
+            self.taken += 1
+
+    def save(self):
+        with self.lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"day": self.day, "used": self.counts}, f, indent=1)
+
+
+class QuotaLimiter:
+    """TokenBucket(초당 속도) + DailyQuota(일일 한도) — http_client의 limiter 자리에 그대로 쓴다
+
+    재시도도 호출 1회로 센다 (한도는 실제 요청 수 기준).
+    """
+
+    def __init__(self, bucket, quota):
+        self.bucket = bucket
+        self.quota = quota
+
+    def acquire(self):
+        self.quota.take()
+        return self.bucket.acquire()
+
+    def block_for(self, seconds):
+        self.bucket.block_for(seconds)
+
+
+def naver_limiter(client_id, quota_path):
+    """네이버 검색 리미터 — 초당 속도 + quota_path에 저장되는 일일 한도 (Client ID별 공유)"""
+    with _limiters_lock:
+        key = ("naver", client_id)
+        if key in _limiters:
+            return _limiters[key]
+        per_second = env_number("NAVER_CALLS_PER_SECOND", NAVER_CALLS_PER_SECOND)
+        bucket = TokenBucket(per_second * 60 if per_second > 0 else None,
+                             env_number("NAVER_BURST", NAVER_BURST, minimum=1))
+        quota = DailyQuota(quota_path, client_id,
+                           env_number("NAVER_DAILY_QUOTA", NAVER_DAILY_QUOTA, int, minimum=1))
+        limit = f"{per_second:g}/초" if per_second > 0 else "무제한"
+        print(f"  ⏱️ 네이버 검색 레이트 리밋: {limit}, 오늘 {quota.used}/{quota.limit}회 사용")
+        limiter = QuotaLimiter(bucket, quota)
+        _limiters[key] = limiter
+        return limiter
@@ -0,0 +1,168 @@
+"""
+AI MESH — 기사 본문의 종목 언급 추출 (컴파일된 단일 정규식)
+별칭 테이블(news_queries)로 프로세스당 한 번 정규식을 만들어
+제목+요약을 한 번만 훑어 모든 티커 · 한글 회사명을 찾는다.
+
+- 티커 기호(3자 이상): 대소문자 무시("Arm CEO"), 앞뒤가 영문/숫자가 아닐 때만
+  (기존 코드처럼 대문자로 바꾼 사본에서 찾는다 — 인라인 (?i:)는 정규식 전체를 느리게 만든다)
+  단, 원문이 전부 소문자인 영문("all", "now")은 일반 단어로 보고 제외
+  (FARM 속 ARM 같은 오탐 방지, MS · HD 같은 2자 티커는 한국 기사에서 다른 뜻이 많아 제외)
+- 검색어의 각 단어(2자 이상): 한글은 조사가 붙으므로 부분 일치,
+  영문 단어(ASML, KLA, ...)는 티커와 같은 경계 · 대소문자 규칙
+- 여러 종목에 걸치는 단어("반도체" 등)는 어느 종목인지 알 수 없으므로 제외
+- relevance(): 종목별 관련도 (제목 언급 > 요약 언급) — 기사를 다른 종목에 나눠 줄 때 기준
+- version: 규칙 · 별칭 표가 바뀌면 달라짐 — 저장 기사의 mentions를 다시 태깅하는 기준
+
+재태깅 속도 측정:
+  python scripts/ticker_matcher.py [nasdaq100|sp500] [news.json 경로]
+"""
+
+import re
+import sys
+import time
+import hashlib
+
+LATIN_RE = re.compile(r"^[A-Za-z0-9&.\-]+$")
+MIN_TICKER_LEN = 3
+MIN_ALIAS_LEN = 2
+MATCHER_RULES_VERSION = 3  # 매칭 규칙을 바꾸면 올림
+
+# 대문자 변환 시 길이가 바뀌는 문자(ß → SS 등)가 있으면 ASCII만 대문자로 — 원문과 위치를 맞추기 위해
+_ASCII_UPPER = str.maketrans("abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+# relevance(): 제목 언급은 그 자체로 충분, 요약 언급은 두 번이면 같은 무게
+TITLE_WEIGHT = 1.0
+DESC_WEIGHT = 0.5
+
+
+def build_aliases(ticker_queries):
+    """{ticker: "검색어 ..."} → {별칭: ticker}"""
+    owners = {}
+    for ticker, query in ticker_queries.items():
+        if len(ticker) >= MIN_TICKER_LEN:
+            owners.setdefault(ticker, set()).add(ticker)
+        for word in query.split():
+            if len(word) >= MIN_ALIAS_LEN:
+                owners.setdefault(word, set()).add(ticker)
+    return {alias: next(iter(ts)) for alias, ts in owners.items() if len(ts) == 1}
+
+
+def trie_pattern(words):
+    """단어 목록 → 접두사를 공유하는 정규식 (단순 A|B|C 나열보다 위치당 검사 횟수가 적다)
+
+    선택적 꼬리는 탐욕적으로 매칭되므로 같은 위치에서는 가장 긴 별칭이 우선한다.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def render(node):
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 and "" not in node else "(?:%s)" % "|".join(branches)
+        if "" in node:
+            body = (body if body.startswith("(?:") else "(?:%s)" % body) + "?"
+        return body
+
+    return render(trie)
+
+
+class TickerMatcher:
+    def __init__(self, ticker_queries):
+        self.aliases = build_aliases(ticker_queries)
+        korean = [a for a in self.aliases if not LATIN_RE.match(a)]
+        # 영문 별칭은 대문자로 모아 대소문자 무시 매칭 (대소문자만 다른 별칭이 다른 종목이면 제외)
+        latin = {}
+        for alias, ticker in self.aliases.items():
+            if LATIN_RE.match(alias):
+                latin.setdefault(alias.upper(), set()).add(ticker)
+        self.latin = {a: next(iter(ts)) for a, ts in latin.items() if len(ts) == 1}
+        # 영문은 대문자 사본에서, 한글은 원문에서 — 패턴을 나눠 각각 한 번씩 훑는다
+        self.latin_pattern = (re.compile(r"(?<![A-Z0-9])%s(?![A-Z0-9])" % trie_pattern(self.latin))
+                              if self.latin else None)
+        self.korean_pattern = re.compile(trie_pattern(korean)) if korean else None
+        self.pattern = self.latin_pattern or self.korean_pattern  # 별칭이 하나라도 있는지
+
+        digest = hashlib.sha256("\n".join(
+            f"{a}:{t}" for a, t in sorted({**self.latin, **{k: self.aliases[k] for k in korean}}.items())
+        ).encode("utf-8")).hexdigest()
+        self.version = f"{MATCHER_RULES_VERSION}.{digest[:8]}"
+
+    def _mentions(self, text):
+        """text의 언급 티커 (등장 순, 중복 포함)"""
+        if self.latin_pattern is not None:
+            upper = text.upper()
+            if len(upper) != len(text):
+                upper = text.translate(_ASCII_UPPER)
+            for m in self.latin_pattern.finditer(upper):
+                if not text[m.start():m.end()].islower():
+                    yield self.latin[m.group(0)]
+        if self.korean_pattern is not None:
+            for m in self.korean_pattern.finditer(text):
+                yield self.aliases[m.group(0)]
+
+    def find(self, title, desc=""):
+        """제목+요약에서 언급된 티커 (정렬된 리스트)"""
+        if self.pattern is None:
+            return []
+        text = f"{title} {desc}"
+        return sorted(set(self._mentions(text)))
+
+    def relevance(self, title, desc=""):
+        """티커 → 관련도 (제목 언급 TITLE_WEIGHT + 요약 언급 횟수 × DESC_WEIGHT, 최대 1.0)"""
+        if self.pattern is None:
+            return {}
+        scores = {}
+        for text, weight in ((title, TITLE_WEIGHT), (desc, DESC_WEIGHT)):
+            for ticker in self._mentions(text or ""):
+                scores[ticker] = min(1.0, scores.get(ticker, 0.0) + weight)
+        return scores
+
+
+def benchmark(matcher, articles, rounds=3):
+    """기사 목록 전체 재태깅 → 초당 기사 수"""
+    texts = [(a.get("title", ""), a.get("desc", "")) for a in articles]
+    if not texts:
+        return 0.0
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for title, desc in texts:
+            matcher.find(title, desc)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(texts) / best if best else float("inf")
+
+
+def main():
+    import os
+    import json
+    from news_queries import NASDAQ100_QUERIES, SP500_QUERIES
+
+    universe = sys.argv[1] if len(sys.argv) > 1 else "nasdaq100"
+    queries = SP500_QUERIES if universe == "sp500" else NASDAQ100_QUERIES
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    default_path = os.path.join(root, "data", "sp500" if universe == "sp500" else "", "news.json")
+    path = sys.argv[2] if len(sys.argv) > 2 else default_path
+
+    if not os.path.exists(path):
+        print(f"  ⚠️ {path} 없음")
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        stocks = json.load(f).get("stocks", {})
+    articles = [a for arts in stocks.values() for a in arts]
+
+    start = time.perf_counter()
+    matcher = TickerMatcher(queries)
+    build_ms = (time.perf_counter() - start) * 1000
+    rate = benchmark(matcher, articles)
+    print(f"🔎 별칭 {len(matcher.aliases)}개 컴파일: {build_ms:.1f} ms")
+    print(f"   기사 {len(articles)}개 재태깅: {rate:,.0f} articles/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+AI MESH — 기업 개요 번역 (MyMemory API) + 번역 메모리
+원문 텍스트의 해시를 키로 번역 결과를 data/translation_memory.json 에 저장한다.
+
+- 티커가 아니라 원문 해시로 찾으므로, 영어 설명이 바뀌면 자동으로 다시 번역되고
+  NASDAQ 100 / S&P 500에 같은 설명이 있으면 한 번만 번역한다.
+- 문장 경계로 자르고 짧은 문장은 500자 한도 안에서 묶어 청크를 만든다.
+  청크 단위로 저장해 긴 설명의 일부만 바뀌어도 나머지 청크는 재사용한다.
+- 메모리에 없는 청크는 중복 제거 후 워커 풀에서 병렬 번역 (MYMEMORY_CALLS_PER_MINUTE)
+- provenance(provider)를 함께 기록:
+    "mymemory" — 정상 번역
+    "seed"     — 기존 profiles.json의 descriptionKr에서 가져옴
+    "source"   — 번역 실패로 원문을 그대로 쓴 경우 → 다음 실행에서 재시도
+"""
+
+import os
+import re
+import json
+import hashlib
+import threading
+import urllib.parse
+from datetime import datetime, timezone
+
+from http_client import get_client, RequestError
+from fetch_engine import get_engine, MYMEMORY_HOST
+from rate_limiter import mymemory_limiter
+
+MYMEMORY_EMAIL = os.environ.get("MYMEMORY_EMAIL", "")
+
+MEMORY_FILENAME = "translation_memory.json"
+CHUNK_LIMIT = 450  # MyMemory 1회 요청 500자 제한 (여유 포함)
+
+PROVIDER_MYMEMORY = "mymemory"
+PROVIDER_SEED = "seed"
+PROVIDER_SOURCE = "source"
+
+HANGUL_RE = re.compile(r"[가-힣]")
+
+# 문장 끝 후보: . ! ? 뒤 공백 + 대문자/숫자/따옴표로 시작
+SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])[\"”’)]?\s+(?=[A-Z0-9\"“(])")
+# 이 단어로 끝나면 문장 끝이 아님 (Inc. / U.S. / e.g. ...)
+ABBREVIATIONS = {
+    "inc", "corp", "co", "ltd", "llc", "plc", "no", "st", "mr", "mrs", "ms", "dr",
+    "jr", "sr", "vs", "approx", "e.g", "i.e", "u.s", "u.k", "u.s.a", "n.v", "s.a",
+}
+
+
+def text_key(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def _ends_with_abbreviation(piece):
+    words = piece.rstrip("\"”’) ").split()
+    if not words:
+        return False
+    last = words[-1].rstrip(".").lower()
+    return last in ABBREVIATIONS or (len(last) == 1 and last.isalpha())
+
+
+def split_sentences(text):
+    """영문 설명 → 문장 목록 (약어 뒤에서는 자르지 않음)"""
+    sentences = []
+    start = 0
+    for m in SENTENCE_BREAK_RE.finditer(text):
+        piece = text[start:m.start()]
+        if _ends_with_abbreviation(piece):
+            continue
+        sentences.append(text[start:m.end()].strip())
+        start = m.end()
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
+
+def _split_long(sentence, limit):
+    """limit보다 긴 문장 → 쉼표/세미콜론/공백 기준으로 나눔"""
+    parts = []
+    while len(sentence) > limit:
+        window = sentence[:limit]
+        cut = max(window.rfind("; "), window.rfind(", "))
+        if cut < limit // 2:
+            cut = window.rfind(" ")
+        if cut <= 0:
+            cut = limit - 1
+        parts.append(sentence[:cut + 1].strip())
+        sentence = sentence[cut + 1:].strip()
+    if sentence:
+        parts.append(sentence)
+    return parts
+
+
+def split_chunks(text, limit=CHUNK_LIMIT):
+    """문장 경계로 자르고, 짧은 문장은 limit 안에서 묶어 요청 수를 최소화"""
+    chunks = []
+    current = ""
+    for sentence in split_sentences(text):
+        for piece in _split_long(sentence, limit):
+            if current and len(current) + 1 + len(piece) > limit:
+                chunks.append(current)
+                current = piece
+            else:
+                current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class TranslationMemory:
+    def __init__(self, path, entries=None):
+        self.path = path
+        self.entries = entries or {}  # key → {"kr", "provider", "len", "ts"}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path, seed_profiles=()):
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return cls(path, json.load(f).get("entries", {}))
+            except Exception as e:
+                print(f"  ⚠️ 번역 메모리 로드 실패: {e}")
+
+        tm = cls(path)
+        for profiles_path in seed_profiles:
+            tm.seed_from_profiles(profiles_path)
+        return tm
+
+    def seed_from_profiles(self, profiles_path):
+        """기존 profiles.json의 (description, descriptionKr) 쌍 → 원문 전체 해시로 등록
+
+        한글이 전혀 없는 descriptionKr(번역 실패로 원문이 저장된 경우)는 가져오지 않는다.
+        """
+        if not os.path.exists(profiles_path):
+            return
+        try:
+            with open(profiles_path, "r", encoding="utf-8") as f:
+                old = json.load(f)
+        except Exception as e:
+            print(f"  ⚠️ 번역 메모리 seed 실패: {e}")
+            return
+        count = 0
+        for d in old.get("data", {}).values():
+            src, kr = d.get("description", ""), d.get("descriptionKr", "")
+            if src and kr and kr != src and HANGUL_RE.search(kr):
+                self.put(src, kr, PROVIDER_SEED)
+                count += 1
+        print(f"  📦 {os.path.basename(os.path.dirname(profiles_path))}/profiles.json에서 번역 메모리 seed: {count}개")
+
+    def get(self, text):
+        """재사용 가능한 번역 (원문 fallback 기록은 None → 재시도 대상)"""
+        with self.lock:
+            entry = self.entries.get(text_key(text))
+        if entry and entry.get("provider") != PROVIDER_SOURCE:
+            return entry["kr"]
+        return None
+
+    def put(self, text, kr, provider):
+        with self.lock:
+            self.entries[text_key(text)] = {
+                "kr": kr,
+                "provider": provider,
+                "len": len(text),
+                "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            }
+
+    def lookup(self, text):
+        """원문 전체 또는 모든 청크가 메모리에 있으면 번역문, 아니면 None"""
+        kr = self.get(text)
+        if kr is None:
+            parts = [self.get(chunk) for chunk in split_chunks(text)]
+            kr = None if any(p is None for p in parts) else " ".join(parts)
+        with self.lock:
+            if kr is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return kr
+
+    def stats(self):
+        with self.lock:
+            by_provider = {}
+            for e in self.entries.values():
+                by_provider[e.get("provider")] = by_provider.get(e.get("provider"), 0) + 1
+        return by_provider
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self.lock:
+            payload = {
+                "updated": datetime.now(timezone.utc).isoformat(),
+                "count": len(self.entries),
+                "entries": self.entries,
+            }
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=1)
+
+
+def translate_chunk(chunk):
+    """MyMemory 1회 호출 (레이트 리미터 경유) → (번역문, provider)"""
+    params = {"q": chunk, "langpair": "en|ko"}
+    if MYMEMORY_EMAIL:
+        params["de"] = MYMEMORY_EMAIL  # 등록 이메일이 있으면 일일 한도 상향
+    url = f"https://api.mymemory.translated.net/get?{urllib.parse.urlencode(params)}"
+    try:
+        resp = get_client().get(url, timeout=15, limiter=mymemory_limiter())
+        data = resp.json() if resp.ok else {}
+        translated = data.get("responseData", {}).get("translatedText", "")
+        if translated and "MYMEMORY WARNING" not in translated:
+            return translated, PROVIDER_MYMEMORY
+    except (RequestError, ValueError):
+        pass
+    return chunk, PROVIDER_SOURCE
+
+
+def translate_many(texts, memory, on_done=None):
+    """{키: 원문} → {키: 번역문}
+
+    모든 원문을 문장 단위 청크로 나눈 뒤, 메모리에 없는 청크만 중복 없이 모아
+    fetch_engine 워커들이 병렬로 번역한다 (MyMemory 레이트 리미터 공유).
+    각 원문은 자기 청크가 모두 끝나는 즉시 입력 순서대로 조립되어 on_done(키, 번역문)으로 전달된다.
+    """
+    plans = [(key, split_chunks(text)) for key, text in texts.items() if text]
+
+    todo = []
+    queued = set()
+    for _, chunks in plans:
+        for chunk in chunks:
+            if chunk not in queued and memory.get(chunk) is None:
+                queued.add(chunk)
+                todo.append(chunk)
+
+    fresh = {}  # 이번 실행 결과 (원문 fallback 포함)
+    results = {}
+    next_plan = 0
+
+    def resolved(chunk):
+        return fresh.get(chunk) if chunk in fresh else memory.get(chunk)
+
+    def flush():
+        nonlocal next_plan
+        while next_plan < len(plans):
+            key, chunks = plans[next_plan]
+            parts = [resolved(c) for c in chunks]
+            if any(p is None for p in parts):
+                return
+            results[key] = " ".join(parts)
+            if on_done:
+                on_done(key, results[key])
+            next_plan += 1
+
+    flush()
+    for chunk, (kr, provider) in get_engine().imap(translate_chunk, todo, MYMEMORY_HOST):
+        memory.put(chunk, kr, provider)
+        fresh[chunk] = kr
+        flush()
+
+    return results
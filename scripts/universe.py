@@ -0,0 +1,118 @@
+"""
+AI MESH — 종목 유니버스 레지스트리
+NASDAQ 100 / S&P 500 티커 목록과 합집합을 한 곳에서 정의한다.
+
+두 지수에 겹치는 종목(NVDA, AAPL, MSFT, ...)은 한 번만 수집하고,
+결과를 각 유니버스의 data 폴더(data/, data/sp500/)로 나눠 쓴다.
+"""
+
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_ROOT = os.path.join(ROOT_DIR, "data")
+
+# NASDAQ 100 — 100 companies (exact match with nasdaq100.html)
+NASDAQ100 = [
+    "NVDA","AVGO","ASML","AMD","QCOM","TXN","ARM","AMAT","INTC","ADI",
+    "MU","LRCX","KLAC","MRVL","NXPI","MCHP","MPWR","STX","WDC","AAPL",
+    "MSFT","AMZN","GOOGL","META","TSLA","NFLX","CSCO","PLTR","CDNS","SNPS",
+    "ADBE","INTU","ADP","WDAY","DDOG","VRSK","CTSH","CSGP","PAYX","MSTR",
+    "PANW","CRWD","FTNT","ZS","TEAM","ADSK","SHOP","ROP","TRI","BKNG",
+    "MELI","APP","ABNB","PYPL","DASH","EA","TTWO","PDD","WBD","MAR",
+    "ROST","WMT","CHTR","CMCSA","COST","PEP","TMUS","SBUX","MDLZ","MNST",
+    "KHC","KDP","CCEP","CEG","XEL","AEP","EXC","ISRG","AMGN","VRTX",
+    "GILD","REGN","GEHC","DXCM","IDXX","ALNY","INSM","LIN","HON","AXON",
+    "CSX","CPRT","ODFL","FAST","FANG","BKR","FER","PCAR","ORLY","CTAS",
+]
+
+# S&P 500 — 500 companies (exact match with index.html)
+SP500 = [
+    "NVDA","AAPL","MSFT","AVGO","ORCL","CSCO","PLTR","INTC","TXN","AMD",
+    "KLAC","AMAT","LRCX","MU","ADI","APH","CRM","ANET","IBM","ACN",
+    "INTU","NOW","ADBE","CRWD","PANW","GLW","SNPS","CDNS","QCOM","APP",
+    "FTNT","NXPI","MPWR","MCHP","DELL","MSI","TEL","STX","WDC","SNDK",
+    "KEYS","ADSK","DDOG","WDAY","HPE","TER","ROP","CTSH","FICO","FISV",
+    "HPQ","JBL","TDY","CDW","BR","FSLR","VRSN","NTAP","SMCI","PTC",
+    "FFIV","TYL","AKAM","GEN","ZBRA","IT","GDDY","ON","Q","CIEN",
+    "EPAM","SWKS","PAYC","BRK.B","JPM","V","MA","BAC","GS","WFC",
+    "MS","C","AXP","SCHW","BLK","PNC","USB","COF","BX","CME",
+    "SPGI","MCO","ICE","CB","PGR","APO","TFC","AJG","AFL","ALL",
+    "MET","TRV","KKR","BK","HOOD","NDAQ","STT","HBAN","FITB","MTB",
+    "RJF","ACGL","HIG","AIG","AMP","COIN","PRU","MSCI","WRB","IBKR",
+    "CBOE","NTRS","WTW","AON","MRSH","FIS","SYF","CFG","CINF","KEY",
+    "RF","CPAY","L","BRO","PYPL","EBAY","GPN","PFG","TROW","BEN",
+    "ERIE","EG","AIZ","JKHY","GL","IVZ","FDS","ARES","XYZ","GOOGL",
+    "META","NFLX","TMUS","DIS","CMCSA","VZ","T","CHTR","WBD","EA",
+    "TTWO","LYV","OMC","TKO","TTD","FOX","PSKY","NWS","MTCH","DASH",
+    "AMZN","TSLA","BKNG","HD","LOW","TJX","MCD","NKE","SBUX","MAR",
+    "HLT","RCL","ABNB","GM","F","CMG","ROST","ORLY","AZO","YUM",
+    "DHI","CVNA","CCL","LVS","DRI","GRMN","ULTA","EXPE","PHM","LEN",
+    "TSCO","NVR","GPC","BBY","DPZ","NCLH","WYNN","MGM","DECK","APTV",
+    "POOL","RL","LULU","WSM","HAS","TPR","SWK","LLY","UNH","JNJ",
+    "MRK","ABBV","TMO","PFE","ABT","AMGN","DHR","GILD","ISRG","SYK",
+    "VRTX","REGN","MDT","BMY","BSX","ELV","HCA","MCK","CI","CVS",
+    "GEHC","IDXX","DXCM","A","IQV","RMD","ZTS","EW","COR","CAH",
+    "BDX","LH","DGX","STE","CNC","HUM","BIIB","MRNA","INCY","ZBH",
+    "MTD","WAT","WST","PODD","HOLX","COO","BAX","DVA","HSIC","VTRS",
+    "CRL","MOH","TECH","RVTY","SOLV","UHS","ALGN","GE","CAT","RTX",
+    "HON","UPS","DE","LMT","BA","GEV","ETN","PH","NOC","GD",
+    "FDX","ITW","WM","EMR","CMI","CTAS","HWM","TT","CSX","UNP",
+    "NSC","UBER","LHX","JCI","CRH","ADP","TDG","PCAR","AXON","RSG",
+    "PWR","MMM","FAST","CPRT","ODFL","AME","DAL","WAB","IR","OTIS",
+    "CARR","ROK","URI","GWW","DOV","VRSK","PAYX","EME","FIX","JBHT",
+    "LDOS","UAL","LUV","TXT","HII","SNA","EXPD","ROL","EFX","VLTO",
+    "CHRW","XYL","J","NDSN","PNR","IEX","LII","FTV","HUBB","MAS",
+    "ALLE","AOS","GNRC","BLDR","TRMB","WMT","COST","PG","KO","PEP",
+    "PM","CL","MDLZ","MNST","MO","KMB","KVUE","KDP","ADM","SYY",
+    "TGT","KR","HSY","GIS","STZ","CHD","KHC","DLTR","DG","CLX",
+    "EL","HRL","BG","TSN","SJM","MKC","TAP","BF.B","CAG","CPB",
+    "LW","XOM","TPL","CVX","COP","SLB","EOG","WMB","PSX","KMI",
+    "VLO","MPC","OKE","BKR","FANG","OXY","TRGP","HAL","DVN","CTRA",
+    "EQT","EXE","APA","NEE","SO","DUK","CEG","AEP","EXC","XEL",
+    "SRE","D","VST","PCG","PEG","ED","ETR","WEC","NRG","DTE",
+    "ES","FE","PPL","EIX","CNP","CMS","AWK","AEE","ATO","LNT",
+    "NI","PNW","AES","EVRG","LIN","NEM","FCX","SHW","APD","ECL",
+    "NUE","VMC","MLM","CTVA","DOW","PPG","DD","STLD","CF","ALB",
+    "IFF","LYB","BALL","AVY","PKG","SW","IP","AMCR","MOS","WELL",
+    "DOC","PLD","EQIX","AMT","SPG","DLR","PSA","O","CCI","EQR",
+    "VTR","CBRE","AVB","EXR","IRM","VICI","SBAC","WY","KIM","MAA",
+    "INVH","CSGP","ESS","REG","CPT","UDR","HST","FRT","BXP","ARE",
+]
+
+UNIVERSES = {
+    "nasdaq100": {
+        "label": "NASDAQ 100",
+        "tickers": NASDAQ100,
+        "data_dir": DATA_ROOT,
+        "logo_dir": os.path.join(DATA_ROOT, "logos"),
+    },
+    "sp500": {
+        "label": "S&P 500",
+        "tickers": SP500,
+        "data_dir": os.path.join(DATA_ROOT, "sp500"),
+        "logo_dir": os.path.join(DATA_ROOT, "sp500", "logos"),
+    },
+}
+
+
+def tickers(name):
+    """유니버스 티커 목록 (중복 제거, 순서 유지)"""
+    return list(dict.fromkeys(UNIVERSES[name]["tickers"]))
+
+
+def union(names):
+    """여러 유니버스의 합집합 (먼저 나온 순서 유지)"""
+    merged = {}
+    for name in names:
+        for ticker in UNIVERSES[name]["tickers"]:
+            merged.setdefault(ticker, None)
+    return list(merged)
+
+
+def parse_universes(value, default):
+    """"nasdaq100,sp500" 같은 문자열 → 유니버스 이름 목록"""
+    names = [v.strip().lower() for v in (value or "").split(",") if v.strip()]
+    unknown = [n for n in names if n not in UNIVERSES]
+    if unknown:
+        raise SystemExit(f"ERROR: 알 수 없는 유니버스: {', '.join(unknown)} (가능: {', '.join(UNIVERSES)})")
+    return names or list(default)